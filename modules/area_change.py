@@ -0,0 +1,159 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from rasterio.crs import CRS
+from . import coastline
+from .combine_hasil import BASE_DIR, STORE_DIR, list_sources
+
+# tabel akresi dan abrasi yang dibaca halaman detail
+# akresi = laut pada periode awal yang menjadi darat pada periode akhir,
+# abrasi = darat pada periode awal yang menjadi laut pada periode akhir
+AREA_CSV = os.path.join(BASE_DIR, "web_app", "hasil_akresi_abrasi_per_tahun.csv")
+AREA_COLUMNS = ["tahun", "startdate", "enddate", "akresi", "abrasi"]
+
+# source_key kedua periode setiap baris tabel, untuk menentukan baris yang perlu dihitung ulang
+AREA_KEYS = os.path.join(STORE_DIR, "area_change_keys.json")
+
+# radius Bumi dalam meter (sama dengan combine_hasil.measure)
+EARTH_RADIUS = 6378137.0
+
+"""
+Menghitung luas setiap baris piksel dalam hektare dari transformasi raster
+    Parameters
+    ----------
+    transform: affine.Affine
+        Transformasi raster (satuan derajat)
+    height: int
+        Banyaknya baris raster
+    crs: str
+        CRS raster, harus CRS geografis (misal EPSG:4326), selain itu ValueError
+
+    Returns
+    -------
+    row_area: numpy.ndarray
+        Array (height,) luas 1 piksel pada setiap baris dalam hektare
+"""
+def pixel_area_ha(transform, height, crs):
+    if not crs or not CRS.from_user_input(crs).is_geographic:
+        raise ValueError(f"luas piksel hanya bisa dihitung untuk raster dengan CRS geografis, bukan {crs!r}")
+
+    # latitude tengah setiap baris piksel
+    lat = transform.f + transform.e * (np.arange(height) + 0.5)
+
+    # ukuran piksel dalam meter, lebar mengecil sesuai cos(latitude)
+    deg = np.pi / 180 * EARTH_RADIUS
+    width_m = abs(transform.a) * deg * np.cos(np.radians(lat))
+    height_m = abs(transform.e) * deg
+    return width_m * height_m / 10000
+
+"""
+Menghitung luas akresi dan abrasi di antara dua mask laut
+    Parameters
+    ----------
+    ocean_start: numpy.ndarray
+        Mask laut pada periode awal
+    ocean_end: numpy.ndarray
+        Mask laut pada periode akhir
+    transform: affine.Affine
+        Transformasi raster
+    crs: str
+        CRS raster (harus geografis)
+
+    Returns
+    -------
+    akresi: float
+        Luas laut yang menjadi darat dalam hektare
+    abrasi: float
+        Luas darat yang menjadi laut dalam hektare
+"""
+def area_change(ocean_start, ocean_end, transform, crs):
+    row_area = pixel_area_ha(transform, ocean_start.shape[0], crs)
+
+    # jumlah piksel yang berubah per baris, lalu dikali luas baris
+    akresi = (ocean_start & ~ocean_end).sum(axis=1) @ row_area
+    abrasi = (~ocean_start & ocean_end).sum(axis=1) @ row_area
+    return float(akresi), float(abrasi)
+
+"""
+Membuat / memperbarui tabel akresi dan abrasi antar periode berurutan dalam 1 tahun
+    Parameters
+    ----------
+    coastlines_all: list of dictionary
+        Hasil combine_hasil.init_result()
+    csv_path: str
+        Path tabel CSV (default AREA_CSV). Baris lama yang source_key kedua
+        periodenya tidak berubah (dicatat di keys_path) dipakai ulang, sisanya dihitung ulang.
+        File hanya ditulis jika ada baris yang berubah.
+    keys_path: str
+        Path file JSON pencatat source_key setiap baris (default AREA_KEYS)
+
+    Returns
+    -------
+    table: pandas.DataFrame
+        Tabel dengan kolom tahun, startdate, enddate, akresi, abrasi (hektare)
+"""
+def update_area_change_table(coastlines_all, csv_path=AREA_CSV, keys_path=AREA_KEYS):
+    entries = {(c["year"], c["period"]): c for c in coastlines_all}
+
+    # baris lama dan source_key yang dipakai saat baris itu dihitung
+    old_table = None
+    previous = {}
+    if os.path.exists(csv_path):
+        old_table = pd.read_csv(csv_path, keep_default_na=False)
+        if set(AREA_COLUMNS).issubset(old_table.columns):
+            for row in old_table[AREA_COLUMNS].to_dict(orient="records"):
+                previous[f"{row['tahun']}|{row['startdate']}|{row['enddate']}"] = row
+    old_keys = {}
+    if os.path.exists(keys_path):
+        with open(keys_path) as f:
+            old_keys = json.load(f)
+
+    # pasangan periode berurutan dalam 1 tahun, sesuai urutan list_sources
+    periods_by_year = {}
+    for source in list_sources():
+        periods_by_year.setdefault(source["year"], []).append(source["period"])
+
+    rows = []
+    keys = {}
+    ocean_masks = {}
+    for year, periods in periods_by_year.items():
+        for start, end in zip(periods[:-1], periods[1:]):
+            c_start, c_end = entries.get((year, start)), entries.get((year, end))
+            name = f"{year}|{start}|{end}"
+            keys[name] = [c_start["source_key"] if c_start else "", c_end["source_key"] if c_end else ""]
+
+            row = previous.get(name)
+            if row is None or old_keys.get(name) != keys[name]:
+                akresi, abrasi = 0.0, 0.0
+                if c_start and c_end:
+                    for c in (c_start, c_end):
+                        if id(c) not in ocean_masks:
+                            ocean_masks[id(c)] = coastline.ocean_mask_from_border(c["mask"] == 1)
+                    try:
+                        akresi, abrasi = area_change(ocean_masks[id(c_start)], ocean_masks[id(c_end)],
+                                                     c_start["transform"], c_start["crs"])
+                    except ValueError as e:
+                        print(f"[WARN] Luas {name} tidak dihitung: {e}")
+                        akresi, abrasi = None, None
+                row = {
+                    "tahun": year,
+                    "startdate": start,
+                    "enddate": end,
+                    "akresi": round(akresi, 2) if akresi is not None else "",
+                    "abrasi": round(abrasi, 2) if abrasi is not None else ""
+                }
+            rows.append(row)
+
+    table = pd.DataFrame(rows, columns=AREA_COLUMNS)
+
+    # tulis ulang hanya jika isi tabel atau catatan key berubah
+    unchanged = (old_table is not None and list(old_table.columns) == AREA_COLUMNS
+                 and len(old_table) == len(table) and old_table.astype(str).values.tolist() == table.astype(str).values.tolist())
+    if not unchanged:
+        table.to_csv(csv_path, index=False)
+    if keys != old_keys:
+        os.makedirs(os.path.dirname(keys_path), exist_ok=True)
+        with open(keys_path, "w") as f:
+            json.dump(keys, f, indent=2)
+    return table
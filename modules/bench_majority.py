@@ -0,0 +1,128 @@
+import sys
+import time
+import numpy as np
+from .coastline import sliding_window_majority
+
+"""
+Implementasi lama sliding_window_majority (loop per piksel), dipakai sebagai acuan
+    Parameters
+    ----------
+    arr: numpy.ndarray
+        Array 2D biner (0 = darat, 1 = air).
+    window_size: int
+        Ukuran jendela (default 7).
+
+    Returns
+    -------
+    result: numpy.ndarray
+        Array hasil setelah diproses sliding window.
+"""
+def reference_majority(arr, window_size=7):
+    pad = window_size // 2
+    rows, cols = arr.shape
+    result = np.zeros_like(arr)
+
+    for i in range(rows):
+        for j in range(cols):
+            r_start, r_end = max(0, i-pad), min(rows, i+pad+1)
+            c_start, c_end = max(0, j-pad), min(cols, j+pad+1)
+
+            window = arr[r_start:r_end, c_start:c_end]
+
+            # penentuan mayoritas
+            ones = np.sum(window)
+            zeros = window.size - ones
+            result[i, j] = 1 if ones >= zeros else 0
+
+    return result
+
+# kombinasi yang diuji: ukuran array, tipe data, dan ukuran jendela
+# (termasuk array 1 piksel, array tipis, dan jendela yang lebih besar dari array)
+SHAPES = [(1, 1), (1, 9), (9, 1), (5, 5), (17, 31), (64, 64), (120, 75)]
+DTYPES = [np.uint8, np.int32, np.int64, np.float32, np.float64, np.bool_]
+WINDOW_SIZES = [1, 3, 5, 7, 9, 15, 41, 201]
+
+"""
+Membandingkan sliding_window_majority dengan implementasi acuan pada mask acak
+    Parameters
+    ----------
+    seed: int
+        Seed mask acak (default 42)
+
+    Returns
+    -------
+    failures: list of str
+        Kombinasi yang hasilnya berbeda (kosong jika semua identik)
+"""
+def check_equal(seed=42):
+    rng = np.random.default_rng(seed)
+    failures = []
+    for shape in SHAPES:
+        # proporsi air berbeda-beda agar kasus seri dan mayoritas darat ikut teruji
+        for water in (0.1, 0.5, 0.9):
+            mask = rng.random(shape) < water
+            for dtype in DTYPES:
+                arr = mask.astype(dtype)
+                for ws in WINDOW_SIZES:
+                    expected = reference_majority(arr, ws)
+                    result = sliding_window_majority(arr, ws)
+                    # identik bit per bit, termasuk tipe data hasil
+                    if (result.dtype != expected.dtype or result.shape != expected.shape
+                            or result.tobytes() != expected.tobytes()):
+                        failures.append(f"shape={shape} water={water} dtype={np.dtype(dtype).name} ws={ws}")
+    return failures
+
+"""
+Mengukur waktu kedua implementasi pada 1 mask acak
+    Parameters
+    ----------
+    shape: tuple of int
+        Ukuran mask (default (300, 300), implementasi acuan lambat untuk mask besar)
+    window_size: int
+        Ukuran jendela (default 7)
+    repeat: int
+        Banyaknya pengulangan sliding_window_majority, diambil waktu tercepat (default 5)
+
+    Returns
+    -------
+    reference_time: float
+        Waktu implementasi acuan dalam detik
+    fast_time: float
+        Waktu tercepat sliding_window_majority dalam detik
+"""
+def benchmark(shape=(300, 300), window_size=7, repeat=5):
+    arr = (np.random.default_rng(0).random(shape) < 0.5).astype(np.uint8)
+
+    start = time.perf_counter()
+    expected = reference_majority(arr, window_size)
+    reference_time = time.perf_counter() - start
+
+    fast_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = sliding_window_majority(arr, window_size)
+        fast_time = min(fast_time, time.perf_counter() - start)
+
+    assert result.tobytes() == expected.tobytes()
+    return reference_time, fast_time
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Uji kesamaan dan benchmark sliding_window_majority")
+    parser.add_argument("--size", type=int, default=300, help="ukuran sisi mask benchmark (default 300)")
+    parser.add_argument("--ws", type=int, default=7, help="ukuran jendela benchmark (default 7)")
+    args = parser.parse_args()
+
+    failures = check_equal()
+    if failures:
+        print(f"{len(failures)} kombinasi berbeda dari implementasi acuan:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    total = len(SHAPES) * 3 * len(DTYPES) * len(WINDOW_SIZES)
+    print(f"{total} kombinasi identik dengan implementasi acuan")
+
+    reference_time, fast_time = benchmark((args.size, args.size), args.ws)
+    print(f"{args.size}x{args.size} ws={args.ws}: acuan {reference_time:.3f} s, "
+          f"sliding_window_majority {fast_time:.4f} s ({reference_time / fast_time:.0f}x)")
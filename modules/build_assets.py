@@ -0,0 +1,152 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from . import combine_hasil
+
+# catatan signature setiap output yang sudah dibuat
+MANIFEST_PATH = os.path.join(combine_hasil.STORE_DIR, "assets_manifest.json")
+
+"""
+Daftar semua gambar statis yang dibangun dari hasil init_result
+    Parameter
+    ---------
+    coastlines_all: list of dictionary
+        Hasil combine_hasil.init_result()
+
+    Return
+    ------
+    targets: list of dictionary
+        1 dictionary berisi kind, year, path output, dan entries (data sumber) 1 gambar
+"""
+def list_targets(coastlines_all):
+    years = sorted({c["year"] for c in coastlines_all})
+    targets = []
+    for year in years:
+        entries = [c for c in coastlines_all if c["year"] == year]
+        targets.append({
+            "kind": "prediction",
+            "year": year,
+            "path": os.path.join(combine_hasil.OUTPUT_DIR_2, f"prediction_all_{year}.png"),
+            "entries": entries
+        })
+        targets.append({
+            "kind": "coastline_year",
+            "year": year,
+            "path": os.path.join(combine_hasil.OUTPUT_DIR, f"coastline_year_{year}.png"),
+            "entries": entries
+        })
+
+    if coastlines_all:
+        targets.append({
+            "kind": "coastline_all",
+            "year": None,
+            "path": os.path.join(combine_hasil.OUTPUT_DIR, "coastline_combined_all.png"),
+            "entries": coastlines_all
+        })
+
+        # perbandingan bawaan untuk seluruh rentang tahun
+        for method, name in (("all", "predictionAll.png"), ("avg", "predictionAvg.png")):
+            targets.append({
+                "kind": f"compare_{method}",
+                "year": (years[0], years[-1]),
+                "path": os.path.join(combine_hasil.COMPARE_DIR, name),
+                "entries": coastlines_all
+            })
+    return targets
+
+"""
+Signature 1 gambar dari source_key (isi file + parameter ekstraksi) semua data sumbernya
+"""
+def target_signature(target):
+    digest = hashlib.sha256(f"{target['kind']}:{target['year']}".encode())
+    for c in target["entries"]:
+        digest.update(c["source_key"].encode())
+    return digest.hexdigest()
+
+"""
+Membuat 1 gambar (dijalankan di worker process)
+    Parameter
+    ---------
+    kind: str
+        Jenis gambar dari list_targets
+    year: int / tuple
+        Tahun gambar, atau (tahun awal, tahun akhir) untuk perbandingan
+    entries: list of dictionary
+        Data sumber gambar
+"""
+def build_target(kind, year, entries):
+    if kind == "prediction":
+        combine_hasil.generate_prediction_all_by_year(year, entries)
+    elif kind == "coastline_year":
+        combine_hasil.generate_coastlines_all_by_year(year, entries)
+    elif kind == "coastline_all":
+        combine_hasil.generate_coastline_all(entries)
+    elif kind == "compare_all":
+        catalog = combine_hasil.CoastlineCatalog(entries)
+        combine_hasil.generate_coastline_compare_new(year[0], year[1], catalog)
+    elif kind == "compare_avg":
+        catalog = combine_hasil.CoastlineCatalog(entries)
+        combine_hasil.generate_coastline_compare_average(year[0], year[1], catalog)
+    else:
+        raise ValueError(f"jenis gambar tidak dikenal: {kind}")
+
+"""
+Membangun semua gambar statis: ekstraksi sekali, lalu render paralel.
+Gambar yang signature-nya sama dengan build sebelumnya dan file-nya masih ada dilewati.
+    Parameter
+    ---------
+    max_workers: int
+        Banyaknya process (default None = jumlah CPU)
+    force: bool
+        True = bangun ulang semua gambar (default False)
+
+    Return
+    ------
+    built: list of str
+        Path gambar yang dibangun ulang
+"""
+def build_all(max_workers=None, force=False):
+    coastlines_all, _ = combine_hasil.init_result(max_workers=max_workers)
+
+    manifest = {}
+    if os.path.exists(MANIFEST_PATH) and not force:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+
+    # pilih gambar yang belum ada atau sumbernya berubah
+    todo = []
+    for target in list_targets(coastlines_all):
+        signature = target_signature(target)
+        name = os.path.relpath(target["path"], combine_hasil.BASE_DIR)
+        if os.path.exists(target["path"]) and manifest.get(name) == signature:
+            continue
+        todo.append((target, signature))
+
+    built = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(build_target, t["kind"], t["year"], t["entries"]) for t, _ in todo]
+        for (target, signature), future in zip(todo, futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"[WARN] Gagal membuat {target['path']}: {e}")
+                continue
+            manifest[os.path.relpath(target["path"], combine_hasil.BASE_DIR)] = signature
+            built.append(target["path"])
+
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return built
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bangun semua gambar statis di web_app/static/assets")
+    parser.add_argument("--workers", type=int, default=None, help="banyaknya process (default jumlah CPU)")
+    parser.add_argument("--force", action="store_true", help="bangun ulang semua gambar")
+    args = parser.parse_args()
+
+    built = build_all(max_workers=args.workers, force=args.force)
+    print(f"{len(built)} gambar dibangun")
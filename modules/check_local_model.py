@@ -0,0 +1,104 @@
+import os
+import sys
+import tempfile
+import numpy as np
+import rasterio
+from rasterio.transform import from_bounds
+from . import training_data
+from .local_model import SENSOR_BANDS, predict_local
+
+# tipe data band stack yang diuji (export Sentinel-2 / Landsat SR berupa integer)
+DTYPES = ["uint16", "int16", "float32"]
+
+# nilai band air dan darat pada band stack buatan
+WATER_VALUE = 500
+LAND_VALUE = 3000
+
+"""
+Membuat band stack buatan yang mencakup semua titik training 1 sensor.
+Piksel titik training diberi nilai sesuai kelasnya, piksel lain acak,
+dan 1 blok piksel di pojok kiri atas diberi nilai nodata.
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    path: str
+        Path GeoTIFF band stack yang dibuat
+    dtype: str
+        Tipe data band stack
+    size: int
+        Ukuran sisi raster dalam piksel (default 200)
+    nodata: int
+        Nilai nodata band stack (default 0)
+
+    Returns
+    -------
+    rows: numpy.ndarray
+        Baris piksel setiap titik training
+    cols: numpy.ndarray
+        Kolom piksel setiap titik training
+"""
+def make_stack(sensor, path, dtype, size=200, nodata=0):
+    points = training_data.load_training_array(sensor)
+    bands = SENSOR_BANDS[sensor]
+    west, east = points[:, 0].min() - 0.001, points[:, 0].max() + 0.001
+    south, north = points[:, 1].min() - 0.001, points[:, 1].max() + 0.001
+    transform = from_bounds(west, south, east, north, size, size)
+
+    rng = np.random.default_rng(0)
+    water = rng.random((size, size)) < 0.5
+    cols, rows = ~transform * (points[:, 0], points[:, 1])
+    rows, cols = rows.astype(int), cols.astype(int)
+    water[rows, cols] = points[:, 2] == 1
+
+    stack = np.where(water, WATER_VALUE, LAND_VALUE) + rng.integers(0, 100, (len(bands), size, size))
+    stack[:, :10, :10] = nodata
+
+    profile = {"driver": "GTiff", "width": size, "height": size, "count": len(bands), "dtype": dtype,
+               "crs": "EPSG:4326", "transform": transform, "nodata": nodata}
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(stack.astype(dtype))
+        dst.descriptions = tuple(bands)
+    return rows, cols
+
+"""
+Menjalankan predict_local pada band stack buatan setiap sensor dan tipe data
+    Returns
+    -------
+    failures: list of str
+        Kombinasi yang gagal beserta alasannya (kosong jika semua berhasil)
+"""
+def check_dtypes():
+    failures = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for sensor in SENSOR_BANDS:
+            points = training_data.load_training_array(sensor)
+            for dtype in DTYPES:
+                name = f"sensor={sensor} dtype={dtype}"
+                stack_path = os.path.join(tmpdir, f"{sensor}_{dtype}.tif")
+                out_path = os.path.join(tmpdir, f"{sensor}_{dtype}_out.tif")
+                rows, cols = make_stack(sensor, stack_path, dtype)
+                try:
+                    predict_local(sensor, stack_path, out_path)
+                except Exception as e:
+                    failures.append(f"{name}: {type(e).__name__}: {e}")
+                    continue
+
+                with rasterio.open(out_path) as src:
+                    classes = src.read(1)
+                if classes.dtype != np.uint8 or not np.isin(classes, (0, 1)).all():
+                    failures.append(f"{name}: hasil bukan raster uint8 0 / 1")
+                elif classes[:10, :10].any():
+                    failures.append(f"{name}: piksel nodata tidak dianggap darat")
+                elif (classes[rows, cols] != points[:, 2]).mean() > 0.05:
+                    failures.append(f"{name}: kelas titik training tidak sesuai")
+    return failures
+
+if __name__ == "__main__":
+    failures = check_dtypes()
+    if failures:
+        print(f"{len(failures)} kombinasi gagal:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print(f"predict_local berhasil untuk {len(SENSOR_BANDS) * len(DTYPES)} kombinasi sensor dan tipe data")
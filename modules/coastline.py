@@ -1,16 +1,26 @@
 import rasterio 
 import numpy as np
+import os
+import tempfile
 from io import BytesIO
-from scipy import ndimage
+from rasterio.windows import Window
+from scipy import ndimage, sparse
+from scipy.sparse import csgraph
 from skimage import measure
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.colors as colors
+from matplotlib.figure import Figure
 import random
 random.seed(42)
 np.random.seed(42)
 
+# warna darat dan air untuk gambar hasil prediksi
+PREDICTION_PALETTE = ["#B40B27", "#3C4DC1"]
+
+# raster dengan piksel lebih dari ini dikoreksi per tile (correct_geotiff_tiled)
+TILED_MIN_PIXELS = 50_000_000
+TILE_SIZE = 1024
+
 """
 Melakukan proses sliding window untuk smoothing hasil prediksi
     Parameters
@@ -28,19 +38,29 @@ Melakukan proses sliding window untuk smoothing hasil prediksi
 def sliding_window_majority(arr, window_size=7):
     pad = window_size // 2
     rows, cols = arr.shape
-    result = np.zeros_like(arr)
-
-    for i in range(rows):
-        for j in range(cols):
-            r_start, r_end = max(0, i-pad), min(rows, i+pad+1)
-            c_start, c_end = max(0, j-pad), min(cols, j+pad+1)
 
-            window = arr[r_start:r_end, c_start:c_end]
-
-            # penentuan mayoritas
-            ones = np.sum(window)
-            zeros = window.size - ones
-            result[i, j] = 1 if ones >= zeros else 0
+    # integral image (summed-area table) dengan baris dan kolom nol di depan
+    acc_dtype = np.float64 if np.issubdtype(arr.dtype, np.floating) else np.int64
+    integral = np.zeros((rows + 1, cols + 1), dtype=acc_dtype)
+    np.cumsum(np.cumsum(arr, axis=0, dtype=acc_dtype), axis=1, out=integral[1:, 1:])
+
+    # batas jendela per baris dan kolom, terpotong di tepi citra
+    r_start = np.clip(np.arange(rows) - pad, 0, rows)
+    r_end = np.clip(np.arange(rows) + pad + 1, 0, rows)
+    c_start = np.clip(np.arange(cols) - pad, 0, cols)
+    c_end = np.clip(np.arange(cols) + pad + 1, 0, cols)
+
+    # jumlah nilai pada setiap jendela dari 4 sudut integral image
+    ones = (integral[np.ix_(r_end, c_end)]
+            - integral[np.ix_(r_start, c_end)]
+            - integral[np.ix_(r_end, c_start)]
+            + integral[np.ix_(r_start, c_start)])
+    size = np.outer(r_end - r_start, c_end - c_start)
+
+    # penentuan mayoritas (seri dianggap air)
+    zeros = size - ones
+    result = np.zeros_like(arr)
+    result[ones >= zeros] = 1
 
     return result
 
@@ -65,12 +85,16 @@ def clean_mask(mask, target_value, min_size):
   binary = (mask == target_value).astype(np.uint8)
 
   labeled, num_features = ndimage.label(binary)
-  sizes = [np.sum(labeled == i) for i in range(1, num_features + 1)]
 
-  for region_id, size in enumerate(sizes, start=1):
-    if size < min_size:
-        # hapus komponen kecil
-        mask[labeled == region_id] = 1 - target_value
+  # ukuran semua region dari satu histogram label
+  sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)
+
+  # lookup table region yang dihapus (label 0 = background)
+  small = sizes < min_size
+  small[0] = False
+
+  # hapus komponen kecil
+  mask[small[labeled]] = 1 - target_value
 
   return mask
 
@@ -106,94 +130,580 @@ def read_geotiff(filepath):
     return array, meta
 
 """
-Ekstraksi garis pantai dari file GeoTIFF untuk Sentinel
+Membagi raster menjadi tile (window rasterio) berukuran tetap
+    Parameters:
+    -----------
+    height: int
+        Tinggi raster
+    width: int
+        Lebar raster
+    tile_size: int
+        Ukuran sisi tile dalam piksel
+    halo: int
+        Lebar tambahan di setiap sisi tile (default 0)
+
+    Returns:
+    --------
+    tiles: list of tuple
+        List (window, core) dengan window = Window yang dibaca (termasuk halo)
+        dan core = (row_slice, col_slice) bagian inti tile di dalam window
+"""
+def iter_tiles(height, width, tile_size, halo=0):
+    tiles = []
+    for row_off in range(0, height, tile_size):
+        for col_off in range(0, width, tile_size):
+            h = min(tile_size, height - row_off)
+            w = min(tile_size, width - col_off)
+
+            # perluas tile dengan halo, terpotong di tepi raster
+            r0, c0 = max(0, row_off - halo), max(0, col_off - halo)
+            r1, c1 = min(height, row_off + h + halo), min(width, col_off + w + halo)
+
+            window = Window(c0, r0, c1 - c0, r1 - r0)
+            core = (slice(row_off - r0, row_off - r0 + h), slice(col_off - c0, col_off - c0 + w))
+            tiles.append((window, core))
+    return tiles
+
+# id global label pada tepi tile (-1 = bukan kelas target)
+def _edge_ids(edge, offset):
+    return np.where(edge > 0, edge + offset - 1, -1)
+
+"""
+Melabeli komponen 1 kelas yang tersebar di beberapa tile dengan id global
+    Parameters:
+    -----------
+    read_tile: callable
+        Fungsi read_tile(window) yang mengembalikan array tile
+    tiles: list of tuple
+        Hasil iter_tiles tanpa halo
+    target_value: int
+        Kelas yang dihitung komponennya (0 = darat atau 1 = air)
+
+    Returns:
+    --------
+    offsets: list of int
+        Id global pertama untuk label lokal pada setiap tile
+    roots: numpy.ndarray
+        Id komponen gabungan (lintas tile) untuk setiap id global
+    sizes: numpy.ndarray
+        Banyaknya piksel setiap id global
+    border: numpy.ndarray
+        Array boolean per id global, True jika menyentuh tepi raster
+"""
+def _tiled_components(read_tile, tiles, target_value):
+    offsets, sizes, border = [], [], []
+    pairs = []
+    next_id = 0
+    height = max(window.row_off + window.height for window, _ in tiles)
+    width = max(window.col_off + window.width for window, _ in tiles)
+
+    # id global pada tepi bawah tile di atas (per kolom tile) dan tepi kanan tile di kiri
+    above = {}
+    left = None
+    for window, core in tiles:
+        labeled, num_features = ndimage.label(read_tile(window) == target_value)
+        offset = next_id
+
+        offsets.append(offset)
+        sizes.append(np.bincount(labeled.ravel(), minlength=num_features + 1)[1:])
+        next_id += num_features
+
+        # label yang menyentuh tepi raster
+        edges = []
+        if window.row_off == 0:
+            edges.append(labeled[0, :])
+        if window.row_off + window.height == height:
+            edges.append(labeled[-1, :])
+        if window.col_off == 0:
+            edges.append(labeled[:, 0])
+        if window.col_off + window.width == width:
+            edges.append(labeled[:, -1])
+        on_border = np.zeros(num_features + 1, dtype=bool)
+        for edge in edges:
+            on_border[edge] = True
+        border.append(on_border[1:])
+
+        if window.col_off == 0:
+            left = None
+
+        # sambungkan komponen yang melewati batas tile (konektivitas 4)
+        for prev, cur in ((above.get(window.col_off), _edge_ids(labeled[0, :], offset)),
+                          (left, _edge_ids(labeled[:, 0], offset))):
+            if prev is None:
+                continue
+            touching = (prev >= 0) & (cur >= 0)
+            if touching.any():
+                pairs.append(np.unique(np.stack([prev[touching], cur[touching]], axis=1), axis=0))
+
+        above[window.col_off] = _edge_ids(labeled[-1, :], offset)
+        left = _edge_ids(labeled[:, -1], offset)
+
+    sizes = np.concatenate(sizes) if sizes else np.zeros(0, dtype=np.int64)
+    border = np.concatenate(border) if border else np.zeros(0, dtype=bool)
+    if pairs:
+        a, b = np.concatenate(pairs).T
+        graph = sparse.coo_matrix((np.ones(len(a), dtype=np.int8), (a, b)), shape=(next_id, next_id))
+        _, roots = csgraph.connected_components(graph, directed=False)
+    else:
+        roots = np.arange(next_id)
+    return offsets, roots, sizes, border
+
+"""
+Menghitung ukuran global setiap komponen yang tersebar di beberapa tile
+    Parameters:
+    -----------
+    read_tile: callable
+        Fungsi read_tile(window) yang mengembalikan array tile
+    tiles: list of tuple
+        Hasil iter_tiles tanpa halo
+    target_value: int
+        Kelas yang dihitung komponennya (0 = darat atau 1 = air)
+    min_size: int
+        Ukuran minimal pada 1 region
+
+    Returns:
+    --------
+    offsets: list of int
+        Id global pertama untuk label lokal pada setiap tile
+    small: numpy.ndarray
+        Array boolean per id global, True jika komponennya lebih kecil dari min_size
+"""
+def _tiled_small_components(read_tile, tiles, target_value, min_size):
+    offsets, roots, sizes, _ = _tiled_components(read_tile, tiles, target_value)
+
+    # ukuran komponen gabungan dari satu histogram per root
+    root_sizes = np.bincount(roots, weights=sizes, minlength=len(roots))
+    small = root_sizes[roots] < min_size
+    return offsets, small
+
+"""
+Versi tile dari clean_mask untuk raster yang tidak muat di memori
+    Parameters:
+    -----------
+    read_tile: callable
+        Fungsi read_tile(window) yang mengembalikan array tile
+    write_tile: callable
+        Fungsi write_tile(window, array) untuk menyimpan tile hasil
+    tiles: list of tuple
+        Hasil iter_tiles tanpa halo
+    target_value: int
+        Target kelas yang akan dibersihkan (0 = darat atau 1 = air)
+    min_size: int
+        Ukuran minimal pada 1 region
+"""
+def clean_mask_tiled(read_tile, write_tile, tiles, target_value, min_size):
+    offsets, small = _tiled_small_components(read_tile, tiles, target_value, min_size)
+
+    for (window, core), offset in zip(tiles, offsets):
+        tile = read_tile(window)
+        labeled, num_features = ndimage.label(tile == target_value)
+
+        # lookup table lokal: label 0 = background, label i = id global offset + i - 1
+        lookup = np.concatenate([[False], small[offset:offset + num_features]])
+        tile[lookup[labeled]] = 1 - target_value
+        write_tile(window, tile)
+
+"""
+Koreksi (flood fill dan sliding window) GeoTIFF besar secara bertahap per tile
     Parameters:
     -----------
     filepath: str
         Path ke file GeoTIFF (0=darat, 1=air)
-    year: str/int 
-        Keterangan tahun GeoTIFF
-    period: str
-        Keterangan periode GeoTIFF
-    water_value: int
-        Nilai yang merepresentasikan air dalam GeoTIFF (default 1)
+    out_path: str
+        Path GeoTIFF hasil koreksi
     land_value: int/float
         Nilai yang merepresentasikan darat dalam GeoTIFF (default 0)
-    ws: int 
+    ws: int
         Nilai window size untuk proses sliding window (default 7)
+    min_water: int
+        Ukuran minimal region air (default 10000)
+    min_land: int
+        Ukuran minimal region darat (default 500)
+    tile_size: int
+        Ukuran sisi tile dalam piksel (default 1024)
 
     Returns:
     --------
-    ocean_mask: numpy.ndarray
-        Mask dari laut (tidak termasuk bercak air)
-    contours: list
-        List koordinat pixel untuk garis pantai
-    contours_geo: list
-        List koordinat geografis (lon, lat) untuk garis pantai
     meta: dict
-        Metadata GeoTIFF
+        Metadata GeoTIFF hasil koreksi
+"""
+def correct_geotiff_tiled(filepath, out_path, land_value=0, ws=7, min_water=10000, min_land=500, tile_size=1024):
+    with rasterio.open(filepath) as src:
+        profile = src.profile.copy()
+        nodata = src.nodata
+        height, width = src.height, src.width
+        dtype = src.dtypes[0]
+        meta = {
+            'transform': src.transform,
+            'crs': src.crs,
+            'bounds': src.bounds,
+            'width': width,
+            'height': height,
+            'nodata': None
+        }
+
+        # hasil antara disimpan di disk agar memori hanya sebesar tile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            work = np.memmap(os.path.join(tmpdir, 'work.dat'), dtype=dtype, mode='w+', shape=(height, width))
+
+            def read_src(window):
+                tile = src.read(1, window=window)
+                if nodata is not None:
+                    tile = np.where(tile == nodata, land_value, tile).astype(dtype)
+                return tile
+
+            def read_work(window):
+                return np.array(work[window.toslices()])
+
+            def write_work(window, tile):
+                work[window.toslices()] = tile
+
+            # flood fill tidak butuh halo karena komponen lintas tile digabung lewat tepinya
+            tiles = iter_tiles(height, width, tile_size)
+            clean_mask_tiled(read_src, write_work, tiles, target_value=1, min_size=min_water)
+            clean_mask_tiled(read_work, write_work, tiles, target_value=0, min_size=min_land)
+
+            # sliding window dengan halo agar jendela di batas tile tetap utuh
+            profile.update(driver='GTiff', count=1, nodata=None)
+            with rasterio.open(out_path, 'w', **profile) as dst:
+                for window, core in iter_tiles(height, width, tile_size, halo=ws // 2):
+                    smoothed = sliding_window_majority(read_work(window), window_size=ws)[core]
+                    out_window = Window(window.col_off + core[1].start, window.row_off + core[0].start,
+                                        smoothed.shape[1], smoothed.shape[0])
+                    dst.write(smoothed, 1, window=out_window)
+
+            del work
+
+    return meta
+
+"""
+Ukuran tile yang dipakai untuk 1 GeoTIFF
+    Parameters:
+    -----------
+    filepath: str
+        Path ke file GeoTIFF
+    tile_size: int
+        None = TILE_SIZE hanya jika raster lebih dari TILED_MIN_PIXELS piksel,
+        0 = tanpa tile (sekaligus di memori), selain itu dipakai apa adanya
+
+    Returns:
+    --------
+    tile_size: int
+        Ukuran sisi tile, 0 jika tanpa tile
+"""
+def resolve_tile_size(filepath, tile_size):
+    if tile_size is None:
+        with rasterio.open(filepath) as src:
+            tile_size = TILE_SIZE if src.width * src.height > TILED_MIN_PIXELS else 0
+    return tile_size
+
+"""
+Array 2D di file sementara tanpa nama (numpy.memmap), file terhapus saat array tidak dipakai lagi
+"""
+def disk_array(shape, dtype):
+    return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+', shape=shape)
+
+"""
+Koreksi (flood fill dan sliding window) 1 GeoTIFF, per tile untuk raster besar
+    Parameters:
+    -----------
+    filepath: str
+        Path ke file GeoTIFF (0=darat, 1=air)
+    land_value: int/float
+        Nilai yang merepresentasikan darat dalam GeoTIFF (default 0)
+    ws: int
+        Nilai window size untuk proses sliding window (default 7)
+    min_water: int
+        Ukuran minimal region air (default 10000)
+    min_land: int
+        Ukuran minimal region darat (default 500)
+    tile_size: int
+        Ukuran sisi tile correct_geotiff_tiled, lihat resolve_tile_size (default None)
+
+    Returns:
+    --------
     array: numpy.ndarray
-        Array 2D dengan nilai 0 (darat) dan 1 (air)
-    fig: figure
-        Gambar hasil garis pantai
+        Array 2D hasil koreksi dengan nilai 0 (darat) dan 1 (air). Pada koreksi per tile
+        berupa numpy.memmap uint8 di file sementara sehingga tidak dimuat ke memori.
+    meta: dict
+        Metadata GeoTIFF
 """
-def extract_coastline_from_geotiff(filepath, year, period, water_value=1, land_value=0, ws = 7):
+def correct_geotiff(filepath, land_value=0, ws=7, min_water=10000, min_land=500, tile_size=None):
+    tile_size = resolve_tile_size(filepath, tile_size)
+
+    if tile_size:
+        # koreksi ke GeoTIFF sementara, hasilnya identik dengan koreksi sekaligus
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out_path = os.path.join(tmpdir, 'corrected.tif')
+            meta = correct_geotiff_tiled(filepath, out_path, land_value=land_value, ws=ws,
+                                         min_water=min_water, min_land=min_land, tile_size=tile_size)
+
+            # salin per tile ke memmap agar raster tidak pernah dimuat utuh
+            array = disk_array((meta['height'], meta['width']), np.uint8)
+            with rasterio.open(out_path) as src:
+                for window, _ in iter_tiles(src.height, src.width, tile_size):
+                    array[window.toslices()] = src.read(1, window=window)
+        return array, meta
+
     array, meta = read_geotiff(filepath)
 
     if meta['nodata'] is not None:
         array = np.where(array == meta['nodata'], land_value, array)
 
     # koreksi sliding window dan flood fill
-    array = clean_mask(array, target_value=1, min_size=10000)
-    array = clean_mask(array, target_value=0, min_size=500)
+    array = clean_mask(array, target_value=1, min_size=min_water)
+    array = clean_mask(array, target_value=0, min_size=min_land)
     array = sliding_window_majority(array, window_size=ws)
-    water_mask = (array == water_value)
-    
-    # tampilkan visualisasi hasil koreksi
-    cmap = colors.ListedColormap(["#B40B27", "#3C4DC1"])
-    bounds = [0, 0.5, 1]
-    norm = colors.BoundaryNorm(bounds, cmap.N)
+    return array, meta
+
+"""
+Menggabungkan list kontur menjadi satu array dengan offset
+    Parameters:
+    -----------
+    contours: list of numpy.ndarray
+        List kontur, masing-masing berukuran (n, 2).
 
-    fig, ax = plt.subplots(figsize=(8, 8))
-    ax.imshow(array, cmap=cmap, norm=norm)
-    ax.axis("off")
-    ax.set_title(f"Prediction After Smoothing - {year}_{period}")
+    Returns:
+    --------
+    packed: numpy.ndarray
+        Array (N, 2) berisi seluruh titik kontur secara berurutan
+    offsets: numpy.ndarray
+        Array (n_kontur + 1,) posisi awal tiap kontur pada packed
+"""
+def pack_contours(contours):
+    lengths = [len(c) for c in contours]
+    offsets = np.zeros(len(contours) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if not contours:
+        return np.empty((0, 2), dtype=np.float64), offsets
+    return np.concatenate(contours, axis=0), offsets
+
+"""
+Memecah array kontur hasil pack_contours kembali menjadi list kontur
+    Parameters:
+    -----------
+    packed: numpy.ndarray
+        Array (N, 2) berisi seluruh titik kontur
+    offsets: numpy.ndarray
+        Array (n_kontur + 1,) posisi awal tiap kontur
+
+    Returns:
+    --------
+    contours: list of numpy.ndarray
+        List kontur (view dari packed, tanpa salinan)
+"""
+def split_contours(packed, offsets):
+    return [packed[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+"""
+Konversi koordinat piksel ke koordinat geografis sekaligus untuk semua titik
+    Parameters:
+    -----------
+    pixels: numpy.ndarray
+        Array (N, 2) berisi koordinat (row, col)
+    transform: affine.Affine
+        Transformasi raster dari metadata GeoTIFF
+
+    Returns:
+    --------
+    coords: numpy.ndarray
+        Array (N, 2) berisi koordinat (lon, lat) pada tengah piksel
+"""
+def pixel_to_geo(pixels, transform):
+    pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+    rows = pixels[:, 0] + 0.5
+    cols = pixels[:, 1] + 0.5
+
+    coords = np.empty_like(pixels)
+    coords[:, 0] = transform.a * cols + transform.b * rows + transform.c
+    coords[:, 1] = transform.d * cols + transform.e * rows + transform.f
+    return coords
+
+"""
+Membuat mask laut dari badan air yang terhubung ke tepi citra
+    Parameters:
+    -----------
+    water_mask: numpy.ndarray
+        Array 2D boolean (True = air)
 
-    # pelabelan badan air selain laut dengan nilai lain
-    labeled_water, num_features = ndimage.label(water_mask)
+    Returns:
+    --------
+    ocean_mask: numpy.ndarray
+        Array 2D boolean, True untuk air yang terhubung ke tepi (laut)
+"""
+def ocean_mask_from_border(water_mask):
+    water_mask = np.asarray(water_mask, dtype=bool)
+
+    # seed hanya dari piksel air pada keempat tepi
+    seed = np.zeros_like(water_mask)
+    seed[0, :] = water_mask[0, :]  # tepi atas
+    seed[-1, :] = water_mask[-1, :]  # tepi bawah
+    seed[:, 0] = water_mask[:, 0]  # tepi kiri
+    seed[:, -1] = water_mask[:, -1]  # tepi kanan
+
+    # sebarkan seed di dalam badan air (konektivitas 4, sama seperti ndimage.label)
+    return ndimage.binary_propagation(seed, mask=water_mask)
+
+"""
+Versi tile dari ocean_mask_from_border untuk raster yang tidak muat di memori.
+Komponen air dilabeli per tile lalu digabung lewat tepi tile (seperti clean_mask_tiled),
+dan komponen yang menyentuh tepi raster menjadi laut.
+    Parameters:
+    -----------
+    array: numpy.ndarray
+        Array 2D (boleh numpy.memmap) dengan nilai 0 (darat) dan 1 (air)
+    water_value: int
+        Nilai yang merepresentasikan air (default 1)
+    tile_size: int
+        Ukuran sisi tile dalam piksel (default TILE_SIZE)
+
+    Returns:
+    --------
+    ocean_mask: numpy.memmap
+        Array 2D uint8 di file sementara, 1 untuk air yang terhubung ke tepi (laut)
+"""
+def ocean_mask_tiled(array, water_value=1, tile_size=TILE_SIZE):
+    height, width = array.shape
+    tiles = iter_tiles(height, width, tile_size)
+
+    def read_tile(window):
+        return np.asarray(array[window.toslices()])
+
+    offsets, roots, _, border = _tiled_components(read_tile, tiles, water_value)
+    ocean_roots = np.zeros(len(roots), dtype=bool)
+    ocean_roots[roots[border]] = True
+    is_ocean = ocean_roots[roots]
+
+    ocean_mask = disk_array((height, width), np.uint8)
+    for (window, _), offset in zip(tiles, offsets):
+        labeled, num_features = ndimage.label(read_tile(window) == water_value)
+        lookup = np.concatenate([[False], is_ocean[offset:offset + num_features]])
+        ocean_mask[window.toslices()] = lookup[labeled]
+    return ocean_mask
+
+"""
+Deteksi kontur garis pantai dari mask laut. find_contours hanya dijalankan pada kotak
+yang memuat batas laut-darat (diperluas 1 piksel), sehingga hasilnya sama persis dengan
+find_contours pada seluruh mask tetapi array float64 internalnya hanya seluas kotak tersebut.
+    Parameters:
+    -----------
+    ocean_mask: numpy.ndarray
+        Array 2D boolean / uint8 (boleh numpy.memmap), True / 1 untuk laut
+    block_rows: int
+        Banyaknya baris yang dibaca sekaligus saat mencari batas (default TILE_SIZE)
 
-    # identifikasi label yang menyentuh tepi
-    ocean_labels = set()
-    h, w = array.shape
+    Returns:
+    --------
+    contours: list of numpy.ndarray
+        List kontur (n, 2) koordinat pixel (row, col)
+"""
+def find_coastline_contours(ocean_mask, block_rows=TILE_SIZE):
+    height, width = ocean_mask.shape
+
+    # kotak piksel yang bertetangga (konektivitas 4) dengan piksel kelas lain
+    r0, r1, c0, c1 = height, -1, width, -1
+    for start in range(0, height, block_rows):
+        block = np.asarray(ocean_mask[start:min(height, start + block_rows + 1)], dtype=bool)
+        changed = np.zeros(block.shape, dtype=bool)
+        vertical = block[1:] != block[:-1]
+        horizontal = block[:, 1:] != block[:, :-1]
+        changed[1:] |= vertical
+        changed[:-1] |= vertical
+        changed[:, 1:] |= horizontal
+        changed[:, :-1] |= horizontal
+        rows = np.flatnonzero(changed.any(axis=1))
+        cols = np.flatnonzero(changed.any(axis=0))
+        if len(rows):
+            r0, r1 = min(r0, start + rows[0]), max(r1, start + rows[-1])
+            c0, c1 = min(c0, cols[0]), max(c1, cols[-1])
+
+    # tanpa batas laut-darat tidak ada kontur
+    if r1 < 0:
+        return []
+
+    # perluas 1 piksel agar semua sel 2x2 yang memuat batas ikut terpotong utuh
+    r0, c0 = max(0, r0 - 1), max(0, c0 - 1)
+    r1, c1 = min(height, r1 + 2), min(width, c1 + 2)
+    crop = np.asarray(ocean_mask[r0:r1, c0:c1], dtype=np.uint8)
+    return [c + (r0, c0) for c in measure.find_contours(crop, 0.5)]
 
-    # cek tepian
-    ocean_labels.update(labeled_water[0, :])  # tepi atas
-    ocean_labels.update(labeled_water[-1, :])  # tepi bawah
-    ocean_labels.update(labeled_water[:, 0])  # tepi kiri
-    ocean_labels.update(labeled_water[:, -1])  # tepi kanan
+"""
+Ekstraksi garis pantai dari file GeoTIFF untuk Sentinel
+    Parameters:
+    -----------
+    filepath: str
+        Path ke file GeoTIFF (0=darat, 1=air)
+    water_value: int
+        Nilai yang merepresentasikan air dalam GeoTIFF (default 1)
+    land_value: int/float
+        Nilai yang merepresentasikan darat dalam GeoTIFF (default 0)
+    ws: int 
+        Nilai window size untuk proses sliding window (default 7)
+    min_water: int
+        Ukuran minimal region air (default 10000)
+    min_land: int
+        Ukuran minimal region darat (default 500)
+    tile_size: int
+        Ukuran tile koreksi dan mask laut, lihat resolve_tile_size (default None = otomatis sesuai ukuran raster)
 
-    # hapus background
-    ocean_labels.discard(0)
+    Returns:
+    --------
+    ocean_mask: numpy.ndarray
+        Mask dari laut (tidak termasuk bercak air), numpy.memmap uint8 pada koreksi per tile
+    contours: numpy.ndarray
+        Array (N, 2) koordinat pixel (row, col) seluruh kontur garis pantai
+    contours_geo: numpy.ndarray
+        Array (N, 2) koordinat geografis (lon, lat) seluruh kontur garis pantai
+    offsets: numpy.ndarray
+        Posisi awal tiap kontur pada contours dan contours_geo
+    meta: dict
+        Metadata GeoTIFF
+    array: numpy.ndarray
+        Array 2D dengan nilai 0 (darat) dan 1 (air), numpy.memmap uint8 pada koreksi per tile
+"""
+def extract_coastline_from_geotiff(filepath, water_value=1, land_value=0, ws = 7, min_water=10000, min_land=500,
+                                   tile_size=None):
+    # koreksi sliding window dan flood fill
+    tile_size = resolve_tile_size(filepath, tile_size)
+    array, meta = correct_geotiff(filepath, land_value=land_value, ws=ws, min_water=min_water,
+                                  min_land=min_land, tile_size=tile_size)
 
-    # simpan hasil mask laut
-    ocean_mask = np.isin(labeled_water, list(ocean_labels))
+    # simpan hasil mask laut (badan air yang terhubung ke tepi)
+    if tile_size:
+        ocean_mask = ocean_mask_tiled(array, water_value=water_value, tile_size=tile_size)
+    else:
+        ocean_mask = ocean_mask_from_border(array == water_value)
 
     # deteksi kontur untuk membuat garis pantai
-    contours = measure.find_contours(ocean_mask.astype(float), 0.5)
+    contours = find_coastline_contours(ocean_mask)
 
     # ubah koordinat piksel ke koordinat geografis (longitude, latitude)
-    contours_geo = []
-    transform = meta['transform']
+    contours, offsets = pack_contours(contours)
+    contours_geo = pixel_to_geo(contours, meta['transform'])
 
-    for contour in contours:
-        geo_coords = []
-        for row, col in contour:
-            # Konversi pixel ke koordinat geografis
-            lon, lat = rasterio.transform.xy(transform, row, col)
-            geo_coords.append((lon, lat))
-        contours_geo.append(np.array(geo_coords))
+    return ocean_mask, contours, contours_geo, offsets, meta, array
 
-    return ocean_mask, contours, contours_geo, meta, array, fig
+"""
+Mewarnai mask hasil prediksi langsung menjadi array RGB (tanpa matplotlib)
+    Parameters:
+    -----------
+    array: numpy.ndarray
+        Array 2D dengan nilai 0 (darat) dan 1 (air)
+    palette: list of str
+        Warna hex untuk darat dan air (default PREDICTION_PALETTE)
+
+    Returns:
+    --------
+    rgb: numpy.ndarray
+        Array (H, W, 3) uint8 hasil pewarnaan
+"""
+def colorize_mask(array, palette=None):
+    palette = PREDICTION_PALETTE if palette is None else palette
+    lut = np.array([[int(h[i:i + 2], 16) for i in (1, 3, 5)] for h in palette], dtype=np.uint8)
+
+    # nilai < 0.5 = darat, >= 0.5 = air (sama seperti BoundaryNorm [0, 0.5, 1])
+    return lut[(np.asarray(array) >= 0.5).astype(np.intp)]
 
 """
 Ekstraksi garis pantai dari input custom user
@@ -211,75 +721,69 @@ Ekstraksi garis pantai dari input custom user
         Nilai yang merepresentasikan darat dalam GeoTIFF (default 0)
     ws: int 
         Nilai window size untuk proses sliding window (default 7)
-"""
-def extract_coastline_from_input(filepath, startDate, endDate, water_value=1, land_value=0, ws = 7):
-    array, meta = read_geotiff(filepath)
-    array = np.where(array == 58, 1, 0).astype(np.uint8)
-
-    if meta['nodata'] is not None:
-        array = np.where(array == meta['nodata'], land_value, array)
+    out_dir: str
+        Folder tujuan prediction.png dan coastline.png (default folder custom_model)
+    tile_size: int
+        Ukuran tile koreksi dan mask laut, lihat resolve_tile_size (default None = otomatis sesuai ukuran raster)
 
+    Returns:
+    --------
+    contours_geo: numpy.ndarray
+        Array (N, 2) koordinat geografis (lon, lat) seluruh kontur garis pantai
+    offsets: numpy.ndarray
+        Posisi awal tiap kontur pada contours_geo
+"""
+def extract_coastline_from_input(filepath, startDate, endDate, water_value=1, land_value=0, ws = 7,
+                                 out_dir='../web_app/static/assets/custom_model', tile_size=None):
     # koreksi sliding window dan flood fill
-    array = clean_mask(array, target_value=1, min_size=7000)
-    array = clean_mask(array, target_value=0, min_size=500)
-    array = sliding_window_majority(array, window_size=ws)
-
-    water_mask = (array == water_value)
-    
-    # plot setelah smoothing 
-    plt.figure(figsize=(8, 8))
-    plt.imshow(array, cmap="coolwarm")
-    plt.axis('off')
-    plt.title(f"Prediksi {startDate} sampai {endDate}")
-    plt.savefig(f'../web_app/static/assets/custom_model/prediction.png',
+    tile_size = resolve_tile_size(filepath, tile_size)
+    array, meta = correct_geotiff(filepath, land_value=land_value, ws=ws, min_water=7000,
+                                  min_land=500, tile_size=tile_size)
+    array = array.astype(np.uint8, copy=False)
+
+    # raster besar diperkecil dulu, gambar 8 inci 300 dpi hanya 2400 piksel
+    preview = array
+    if tile_size:
+        step = max(1, -(-max(array.shape) // 2400))
+        preview = np.asarray(array[::step, ::step])
+
+    # plot setelah smoothing
+    # (Figure tanpa pyplot agar aman dijalankan beberapa job sekaligus di thread berbeda)
+    fig = Figure(figsize=(8, 8))
+    ax = fig.add_subplot()
+    ax.imshow(preview, cmap="coolwarm")
+    ax.axis('off')
+    ax.set_title(f"Prediksi {startDate} sampai {endDate}")
+    fig.savefig(os.path.join(out_dir, 'prediction.png'),
                 dpi=300, 
                 bbox_inches='tight')
-    # plt.show()
 
-    # pelabelan badan air selain laut dengan nilai lain
-    labeled_water, num_features = ndimage.label(water_mask)
-
-    # identifikasi label yang menyentuh tepi
-    ocean_labels = set()
-    h, w = array.shape
-
-    # cek tepian
-    ocean_labels.update(labeled_water[0, :])  # tepi atas
-    ocean_labels.update(labeled_water[-1, :])  # tepi bawah
-    ocean_labels.update(labeled_water[:, 0])  # tepi kiri
-    ocean_labels.update(labeled_water[:, -1])  # tepi kanan
-
-    # hapus background
-    ocean_labels.discard(0)
-
-    # simpan hasil mask laut
-    ocean_mask = np.isin(labeled_water, list(ocean_labels))
+    # simpan hasil mask laut (badan air yang terhubung ke tepi)
+    if tile_size:
+        ocean_mask = ocean_mask_tiled(array, water_value=water_value, tile_size=tile_size)
+    else:
+        ocean_mask = ocean_mask_from_border(array == water_value)
 
     # deteksi kontur untuk membuat garis pantai
-    contours = measure.find_contours(ocean_mask.astype(float), 0.5)
+    contours = find_coastline_contours(ocean_mask)
 
     # ubah koordinat piksel ke koordinat geografis (longitude, latitude)
-    contours_geo = []
-    transform = meta['transform']
-
-    for contour in contours:
-        geo_coords = []
-        for row, col in contour:
-            lon, lat = rasterio.transform.xy(transform, row, col)
-            geo_coords.append((lon, lat))
-        contours_geo.append(np.array(geo_coords))
+    contours, offsets = pack_contours(contours)
+    contours_geo = pixel_to_geo(contours, meta['transform'])
 
-    plt.figure(figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    ax = fig.add_subplot()
 
-    for contour in contours_geo:
+    for contour in split_contours(contours_geo, offsets):
         xs = [pt[0] for pt in contour]
         ys = [pt[1] for pt in contour]  
-        plt.plot(xs, ys, linewidth=2, label=f"{startDate} {endDate}")
+        ax.plot(xs, ys, linewidth=2, label=f"{startDate} {endDate}")
 
-    plt.title(f"Garis Pantai {startDate} sampai {endDate}")
-    plt.xlabel("Longitude")
-    plt.ylabel("Latitude")
-    # plt.show()
-    plt.savefig(f'../web_app/static/assets/custom_model/coastline.png',
+    ax.set_title(f"Garis Pantai {startDate} sampai {endDate}")
+    ax.set_xlabel("Longitude")
+    ax.set_ylabel("Latitude")
+    fig.savefig(os.path.join(out_dir, 'coastline.png'),
             dpi=300, 
-            bbox_inches='tight')
\ No newline at end of file
+            bbox_inches='tight')
+
+    return contours_geo, offsets
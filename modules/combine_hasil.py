@@ -1,11 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
+from matplotlib.figure import Figure
 import random
 import os
-import io
-import math
-from PIL import Image
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageDraw, ImageFont
+from scipy.spatial import cKDTree
+from rasterio.transform import Affine
+from rasterio.warp import transform as transform_coords
 random.seed(42)
 np.random.seed(42)
 from . import coastline
@@ -14,7 +19,12 @@ from . import coastline
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))  # naik 1 level dari modules/
 OUTPUT_DIR = os.path.join(BASE_DIR, "web_app", "static", "assets", "coastlines")
 OUTPUT_DIR_2 = os.path.join(BASE_DIR, "web_app", "static", "assets", "predictions")
+COMPARE_DIR = os.path.join(BASE_DIR, "web_app", "static", "assets", "compare")
 BASE_MODULES = os.path.dirname(__file__)
+STORE_DIR = os.path.join(BASE_MODULES, "coastline_store")
+
+# parameter ekstraksi garis pantai (ikut menjadi kunci cache di STORE_DIR)
+EXTRACT_PARAMS = {"ws": 7, "min_water": 10000, "min_land": 500}
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -39,100 +49,262 @@ def convert_q_to_text(period):
     }
     return mapping.get(period, period)
 
+"""
+Daftar semua file GeoTIFF Landsat dan Sentinel yang akan diproses
+    Returns
+    -------
+    sources: list of dictionary
+        1 dictionary berisi sensor, year, period, group_name, dan filepath dari 1 file GeoTIFF,
+        terurut berdasarkan (tahun, periode)
+"""
+def list_sources():
+    sources = []
+
+    # file Landsat
+    for year in range(2013, 2019):
+        for period in ["Jan_Jun", "Jul_Des"]:
+            sources.append({
+                "sensor": "landsat",
+                "year": year,
+                "period": period,
+                "group_name": f"{year} {period}",
+                "filepath": os.path.join(BASE_MODULES, 'LANDSAT8', f"Landsat8_Predict_{year}_{period}.tif")
+            })
+
+    # file Sentinel
+    for year in range(2019, 2025):
+        for period in ["q1", "q2", "q3", "q4"]:
+            new_period = convert_q_to_text(period)
+            sources.append({
+                "sensor": "sentinel",
+                "year": year,
+                "period": new_period,
+                "group_name": f"{year}_{new_period}",
+                "filepath": os.path.join(BASE_MODULES, 'SENTINEL2', f"prediction_final_{year}_{period}.tif")
+            })
+
+    return sources
+
+"""
+Koreksi dan ekstraksi garis pantai dari 1 file GeoTIFF (dijalankan di worker process)
+    Parameters
+    ----------
+    source: dictionary
+        1 item dari list_sources()
+
+    Returns
+    -------
+    result: dictionary
+        1 dictionary yang menyimpan informasi mengenai informasi dari 1 file GeoTIFF
+"""
+def extract_source(source):
+    ocean_mask, contours_pixel, contours_geo, offsets, meta, array = coastline.extract_coastline_from_geotiff(
+        source["filepath"],
+        water_value=1,
+        land_value=0,
+        **EXTRACT_PARAMS
+    )
+    return {
+        "sensor": source["sensor"],
+        "year": source["year"],
+        "period": source["period"],
+        "group_name": source["group_name"],
+        "mask": array,
+        "transform": meta["transform"],
+        "crs": meta["crs"].to_string() if meta["crs"] is not None else "",
+        "coastline": coastline.split_contours(contours_geo, offsets)
+    }
+
+"""
+Menjalankan extract_source untuk banyak file, paralel dengan process pool
+    Parameters
+    ----------
+    sources: list of dictionary
+        Item dari list_sources() yang akan diproses
+    max_workers: int
+        Banyaknya process (None = jumlah CPU, 1 = tanpa process pool)
+
+    Returns
+    -------
+    results: list
+        Hasil extract_source atau Exception untuk setiap source, sesuai urutan sources
+"""
+def extract_sources(sources, max_workers=None):
+    results = []
+    if max_workers == 1:
+        for source in sources:
+            try:
+                results.append(extract_source(source))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    # hasil diambil sesuai urutan sources agar urutan (tahun, periode) tetap
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(extract_source, source) for source in sources]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+"""
+Membuat kunci cache dari isi file GeoTIFF dan parameter ekstraksi
+    Parameters
+    ----------
+    filepath: str
+        Path ke file GeoTIFF
+
+    Returns
+    -------
+    key: str
+        Hash sha256 isi file digabung dengan EXTRACT_PARAMS
+"""
+def source_key(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    params = "-".join(f"{k}{v}" for k, v in sorted(EXTRACT_PARAMS.items()))
+    return f"{digest.hexdigest()}-{params}"
+
+"""
+Membaca 1 hasil ekstraksi dari store
+    Parameters
+    ----------
+    path: str
+        Path file .npz di store
+    key: str
+        Kunci cache yang diharapkan (hasil source_key)
+    source: dictionary
+        1 item dari list_sources()
+
+    Returns
+    -------
+    result: dictionary / None
+        Hasil ekstraksi, atau None jika file tidak ada atau sudah usang
+"""
+def load_stored_source(path, key, source):
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            if str(data["key"]) != key:
+                return None
+            return {
+                "sensor": source["sensor"],
+                "year": source["year"],
+                "period": source["period"],
+                "group_name": source["group_name"],
+                "mask": data["mask"],
+                "transform": Affine(*data["transform"]),
+                "crs": str(data["crs"]),
+                "coastline": coastline.split_contours(data["coastline"], data["offsets"])
+            }
+    except (OSError, ValueError, KeyError):
+        return None
+
+"""
+Menyimpan 1 hasil ekstraksi ke store (npz terkompresi)
+    Parameters
+    ----------
+    path: str
+        Path file .npz di store
+    key: str
+        Kunci cache (hasil source_key)
+    result: dictionary
+        Hasil extract_source
+"""
+def save_stored_source(path, key, result):
+    packed, offsets = coastline.pack_contours(result["coastline"])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # tulis ke file sementara dulu agar store tidak rusak kalau proses terhenti
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.savez_compressed(
+            f,
+            key=np.array(key),
+            mask=result["mask"],
+            transform=np.array(tuple(result["transform"])[:6]),
+            crs=np.array(result["crs"]),
+            coastline=packed,
+            offsets=offsets
+        )
+    os.replace(tmp_path, path)
+
 """
 Koreksi dan membuat data garis pantai dari semua file Landsat dan Sentinel
+    Parameters
+    ----------
+    max_workers: int
+        Banyaknya process untuk ekstraksi paralel (default None = jumlah CPU, 1 = tanpa process pool)
+    store_dir: str
+        Folder store hasil ekstraksi (default STORE_DIR). File yang isinya dan
+        EXTRACT_PARAMS tidak berubah dibaca dari store, sisanya diekstraksi ulang.
+        None = selalu ekstraksi ulang tanpa store.
+
     Returns
     -------
     coastlines_all: list of dictionary 
-        1 dictionary yang menyimpan informasi mengenai informasi dari 1 file GeoTIFF 
+        1 dictionary yang menyimpan informasi mengenai informasi dari 1 file GeoTIFF
+        (termasuk source_key, hash isi file dan parameter ekstraksi)
     listPlot: list of int 
         List yang menyimpan informasi banyaknya data yang ada pada 1 tahun
 """
-def init_result():
+def init_result(max_workers=None, store_dir=STORE_DIR):
+    # file yang tidak ada (periode tanpa data) dilewati
+    sources = [s for s in list_sources() if os.path.exists(s["filepath"])]
+    results = [None] * len(sources)
+    keys = [source_key(source["filepath"]) for source in sources]
+
+    # ambil hasil yang masih valid dari store
+    if store_dir is not None:
+        paths = []
+        for i, source in enumerate(sources):
+            name = os.path.splitext(os.path.basename(source["filepath"]))[0]
+            paths.append(os.path.join(store_dir, f"{name}.npz"))
+            results[i] = load_stored_source(paths[i], keys[i], source)
+
+    # ekstraksi ulang hanya untuk yang belum ada atau usang
+    stale = [i for i, result in enumerate(results) if result is None]
+    if stale:
+        extracted = extract_sources([sources[i] for i in stale], max_workers)
+        for i, result in zip(stale, extracted):
+            results[i] = result
+            if store_dir is not None and not isinstance(result, Exception):
+                save_stored_source(paths[i], keys[i], result)
+
     coastlines_all = []
-    years = range(2013, 2019)
-    periods = ["Jan_Jun", "Jul_Des"]
-    listPlot = []
-                
-    # baca dan koreksi semua file Landsat
-    for year in years:
-        numPlot = 0
-        for period in periods:
-            # filepath = f"modules/LANDSAT8/Landsat8_Predict_{year}_{period}.tif"
-            filepath = os.path.join(BASE_MODULES, 'LANDSAT8', f"Landsat8_Predict_{year}_{period}.tif")
-            try:
-                # --- ekstraksi ---
-                ocean_mask, contours_pixel, contours_geo, meta, array, fig = coastline.extract_coastline_from_geotiff(
-                    filepath,
-                    year,
-                    period,
-                    water_value=1,
-                    land_value=0,
-                    ws = 7
-                )
-                transform = meta["transform"]
-                coastlines_all.append({
-                    "year": year,
-                    "period": period,
-                    "group_name": f"{year} {period}",
-                    "mask": array,
-                    "transform": transform,
-                    "coastline": contours_geo,
-                    "plot": fig
-                })
-                numPlot+=1
-                plt.close(fig)
-            except Exception as e:
-                continue
-                # print(f"Gagal baca {filepath}: {e}")
-        listPlot.append(numPlot)
-        # print(listPlot)     
-
-    # baca dan koreksi semua file Sentinel
-    years = range(2019, 2025)
-    periods = ["q1", "q2", "q3", "q4"]    
-    for year in years:
-        numPlot = 0
-        for period in periods:
-            #filepath = f"modules/SENTINEL2/prediction_final_{year}_{period}.tif"
-            filepath = os.path.join(BASE_MODULES, 'SENTINEL2', f"prediction_final_{year}_{period}.tif")
-            try:
-                # ekstraksi coastline
-                ocean_mask, contours_pixel, contours_geo, meta, array, fig = coastline.extract_coastline_from_geotiff(
-                    filepath,
-                    year,
-                    period,
-                    water_value=1,
-                    land_value=0,
-                    ws = 7
-                )
-                transform = meta["transform"]
-                new_period = convert_q_to_text(period)
-
-                coastlines_all.append({
-                    "year": year,
-                    "period": new_period,
-                    "group_name": f"{year}_{new_period}",
-                    "mask": array,
-                    "transform": transform,
-                    "coastline": contours_geo,
-                    "plot": fig
-                })
-                plt.close(fig)
-                numPlot+=1
-            except Exception as e:
-                continue
-                # print(f"Gagal baca {filepath}: {e}")
-        listPlot.append(numPlot)
-        # print(listPlot) 
+    for source, key, result in zip(sources, keys, results):
+        if isinstance(result, Exception):
+            print(f"[WARN] Gagal baca {source['filepath']}: {result}")
+            continue
+        result["source_key"] = key
+        coastlines_all.append(result)
+
+    # banyaknya data per tahun
+    years = [s["year"] for s in list_sources()]
+    listPlot = [sum(1 for c in coastlines_all if c["year"] == year) for year in sorted(set(years))]
 
     return coastlines_all, listPlot
 
 """
 Plotting garis pantai yang sudah dihasilkan
+    Parameter
+    ---------
+    coastlines_all: list of dictionary
+        Hasil init_result() (default None = jalankan init_result())
+
+    Return
+    ------
+    coastlines_all: list of dictionary
+        Data garis pantai yang diplot
 """
-def generate_coastline_all():
-    coastlines_all, listPlot = init_result()
+def generate_coastline_all(coastlines_all=None):
+    if coastlines_all is None:
+        coastlines_all, listPlot = init_result()
     
     # atur palet warna
     years = sorted(set([c["year"] for c in coastlines_all]))
@@ -168,6 +340,9 @@ def generate_coastline_all():
     plt.axis("equal")
     plt.savefig(os.path.join(OUTPUT_DIR, "coastline_combined_all.png"),
                 dpi=300, bbox_inches='tight')
+    plt.close()
+
+    return coastlines_all
 
 """
 Interpolasi garis pantai agar punya jumlah titik seragam.
@@ -201,23 +376,164 @@ def interpolate_line(line, num_points=1000):
     return np.column_stack((x_interp, y_interp))
 
 """
-Mengubah figure (plot) menjadi array
+Katalog garis pantai terindeks berdasarkan tahun, periode, dan sensor.
+Setiap garis pantai utama (kontur pertama) disimpan sudah diinterpolasi ke
+num_points titik dalam satu array kontigu (n_lines, num_points, 2), sehingga
+query rentang tahun cukup berupa slice tanpa interpolasi ulang.
+    Parameters
+    ----------
+    coastlines_all: list of dictionary
+        Hasil init_result(), terurut berdasarkan (tahun, periode)
+    num_points: int
+        Banyaknya titik hasil interpolasi (default 1000)
+"""
+class CoastlineCatalog:
+    def __init__(self, coastlines_all, num_points=1000):
+        self.num_points = num_points
+        self.years = np.array([c["year"] for c in coastlines_all], dtype=int)
+        self.periods = np.array([c["period"] for c in coastlines_all])
+        self.sensors = np.array([c.get("sensor", "") for c in coastlines_all])
+        self.group_names = [c["group_name"] for c in coastlines_all]
+
+        self.lines = np.empty((len(coastlines_all), num_points, 2), dtype=np.float64)
+        for i, c in enumerate(coastlines_all):
+            self.lines[i] = interpolate_line(c["coastline"][0], num_points)
+
+        # spatial index per garis, dibuat saat pertama kali dibutuhkan
+        self._indexes = {}
+
+        # mask semua garis pantai sebagai acuan sisi laut, mask lautnya dibuat saat dibutuhkan
+        self._ocean_sources = [c for c in coastlines_all if "mask" in c]
+        self._ocean = None
+
+    def __len__(self):
+        return len(self.years)
+
+    """
+    Slice data untuk rentang tahun [startYear, endYear]
+        Returns
+        -------
+        slice
+            Slice ke lines / group_names (data sudah terurut berdasarkan tahun)
+    """
+    def year_slice(self, startYear, endYear):
+        start = np.searchsorted(self.years, startYear, side="left")
+        end = np.searchsorted(self.years, endYear, side="right")
+        return slice(start, end)
+
+    """
+    Spatial index (build_line_index) untuk garis ke-i, dibuat sekali lalu disimpan
+    """
+    def line_index(self, i):
+        if i not in self._indexes:
+            self._indexes[i] = build_line_index(self.lines[i])
+        return self._indexes[i]
+
+    """
+    Frekuensi laut acuan untuk menentukan sisi laut garis pantai (dibuat sekali lalu disimpan)
+        Returns
+        -------
+        ocean: tuple
+            (ocean_freq, transform, crs). ocean_freq berisi proporsi garis pantai
+            (yang grid-nya sama dengan garis pantai pertama) yang piksel tersebut berupa laut.
+            None jika katalog dibuat tanpa mask
+    """
+    def ocean_reference(self):
+        if self._ocean is None and self._ocean_sources:
+            first = self._ocean_sources[0]
+            same_grid = [c for c in self._ocean_sources
+                         if c["mask"].shape == first["mask"].shape and c["transform"] == first["transform"]]
+            ocean_freq = np.zeros(first["mask"].shape, dtype=np.float32)
+            for c in same_grid:
+                ocean_freq += coastline.ocean_mask_from_border(c["mask"] == 1)
+            ocean_freq /= len(same_grid)
+            self._ocean = (ocean_freq, first["transform"], first.get("crs") or "EPSG:4326")
+        return self._ocean
+
+    """
+    Index data berdasarkan filter tahun, periode, dan/atau sensor
+        Returns
+        -------
+        numpy.ndarray
+            Index data yang sesuai semua filter yang diberikan
+    """
+    def select(self, year=None, period=None, sensor=None):
+        keep = np.ones(len(self), dtype=bool)
+        if year is not None:
+            keep &= self.years == year
+        if period is not None:
+            keep &= self.periods == period
+        if sensor is not None:
+            keep &= self.sensors == sensor
+        return np.flatnonzero(keep)
+
+# ukuran sisi panjang target 1 panel pada grid gambar (piksel)
+PANEL_SIZE = 1600
+
+"""
+Menentukan pengecilan dan pembesaran mask agar sisi panjang panel mendekati panel_size
     Parameter
     ---------
-    fig: figure
-        gambar plot hasil prediksi
-    
+    shape: tuple of int
+        Ukuran mask (tinggi, lebar)
+    panel_size: int
+        Target sisi panjang panel dalam piksel (default PANEL_SIZE)
+
+    Return
+    ------
+    step: int
+        Jarak pengambilan piksel (mask[::step, ::step]), > 1 jika mask lebih besar dari panel_size
+    scale: int
+        Faktor pembesaran piksel untuk tile_images, 1 jika mask diperkecil
+"""
+def panel_scale(shape, panel_size=PANEL_SIZE):
+    longest = max(shape[:2])
+    if longest > panel_size:
+        return -(-longest // panel_size), 1
+    return 1, max(1, round(panel_size / longest))
+
+"""
+Menyusun beberapa gambar RGB menjadi satu grid dengan judul di atas setiap gambar
+    Parameter
+    ---------
+    images: list of numpy.ndarray
+        Array (H, W, 3) uint8 dengan ukuran sama
+    titles: list of str
+        Judul untuk setiap gambar
+    cols: int
+        Banyaknya kolom grid
+    scale: int
+        Faktor pembesaran piksel (nearest neighbour, default None = dari panel_scale)
+
     Return
     ------
-    np.array(img)
-        array hasil konversi figure dengan dimensi (Height, Weight, 3) 
+    grid: PIL.Image
+        Gambar gabungan
 """
-def fig_to_array(fig):
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight")
-    buf.seek(0)
-    img = Image.open(buf)
-    return np.array(img)
+def tile_images(images, titles, cols, scale=None):
+    if scale is None:
+        scale = panel_scale(images[0].shape)[1]
+    rows = -(-len(images) // cols)
+    h, w = images[0].shape[0] * scale, images[0].shape[1] * scale
+    pad, title_h = 24, 64
+
+    grid = np.full((rows * (h + title_h + pad) + pad, cols * (w + pad) + pad, 3), 255, dtype=np.uint8)
+    for i, img in enumerate(images):
+        r, col = divmod(i, cols)
+        top = pad + r * (h + title_h + pad) + title_h
+        left = pad + col * (w + pad)
+        grid[top:top + h, left:left + w] = np.repeat(np.repeat(img, scale, axis=0), scale, axis=1)
+
+    # tulis judul di atas setiap gambar
+    canvas = Image.fromarray(grid)
+    draw = ImageDraw.Draw(canvas)
+    font = ImageFont.load_default(size=40)
+    for i, title in enumerate(titles):
+        r, col = divmod(i, cols)
+        cx = pad + col * (w + pad) + w // 2
+        cy = pad + r * (h + title_h + pad) + title_h // 2
+        draw.text((cx, cy), title, fill=(0, 0, 0), font=font, anchor="mm")
+    return canvas
 
 """
 Generate list gambar hasil prediksi per tahun
@@ -225,46 +541,37 @@ Generate list gambar hasil prediksi per tahun
     ---------
     year: str/int
         Tahun yang akan diproses untuk menggabungkan seluruh hasil prediksi
+    coastlines_all: list of dictionary
+        Hasil init_result() (default None = jalankan init_result())
 """
-def generate_prediction_all_by_year(year):
-    coastlines_all, listPlot = init_result()
+def generate_prediction_all_by_year(year, coastlines_all=None):
+    if coastlines_all is None:
+        coastlines_all, listPlot = init_result()
     # filter tahun
     data_year = [c for c in coastlines_all if c["year"] == year]
-    n_fig = listPlot[year-2013]
+    n_fig = len(data_year)
+    if not data_year:
+        print(f"[WARN] Tidak ada data prediksi untuk tahun {year}")
+        return None
 
-    # layout subplot: max 4 (2x2)
-    rows = 2 if n_fig > 2 else 1
+    # layout grid: max 4 (2x2)
     cols = 2 if n_fig > 1 else 1
 
-    fig, axes = plt.subplots(rows, cols, figsize=(6*cols, 6*rows))
-    axes = np.array(axes).flatten()
-
     # sort periods agar berurutan
     period_order = ["Jan_Jun", "Jul_Des", "Jan_Mar", "Apr_Jun", "Jul_Sep", "Okt_Des"]
     data_year = sorted(data_year, key=lambda x: period_order.index(x["period"]))
 
-    for i in range(n_fig):
-        fig_old = data_year[i]["plot"]
-        period = data_year[i]["period"]
-
-        img = fig_to_array(fig_old)  # convert fig to array
+    # mask besar diperkecil dulu agar panel tidak jauh melebihi PANEL_SIZE
+    step, scale = panel_scale(data_year[0]["mask"].shape)
 
-        axes[i].imshow(img)
-        axes[i].axis("off")
-        axes[i].set_title(period)
-
-    # kosongkan subplot yang tidak terpakai
-    for j in range(n_fig, len(axes)):
-        axes[j].axis("off")
-
-    # judul besar
-    # plt.suptitle(f"prediction_all - {year}", fontsize=18)
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    # warnai mask langsung menjadi RGB lalu susun per grid
+    images = [coastline.colorize_mask(c["mask"][::step, ::step]) for c in data_year[:n_fig]]
+    titles = [c["period"] for c in data_year[:n_fig]]
+    grid = tile_images(images, titles, cols, scale=scale)
 
     # simpan file
     out_file = os.path.join(OUTPUT_DIR_2, f"prediction_all_{year}.png")
-    plt.savefig(out_file, dpi=300, bbox_inches="tight")
-    plt.close(fig)
+    grid.save(out_file)
 
 """
 Generate gabungan coastline per tahun
@@ -272,9 +579,12 @@ Generate gabungan coastline per tahun
     ---------
     year: str/int
         Tahun yang akan diproses untuk menggabungkan seluruh hasil garis pantai
+    coastlines_all: list of dictionary
+        Hasil init_result() (default None = jalankan init_result())
 """
-def generate_coastlines_all_by_year(year):
-    coastlines_all = generate_coastline_all()
+def generate_coastlines_all_by_year(year, coastlines_all=None):
+    if coastlines_all is None:
+        coastlines_all, listPlot = init_result()
 
     # ambil data sesuai tahun masukkan
     data_year = [c for c in coastlines_all if c["year"] == year]
@@ -342,27 +652,157 @@ Menghitung jarak dua koordinat (lat, lon) dalam meter menggunakan rumus Haversin
         Hasil jarak antara 2 titik dalam satuan meter
 """
 def measure(lat1, lon1, lat2, lon2):
+    return float(measure_haversine(lat1, lon1, lat2, lon2))
+
+"""
+Menghitung jarak banyak pasangan koordinat sekaligus menggunakan rumus Haversine.
+    Parameter
+    ---------
+    lat1, lon1: numpy.ndarray
+        Latitude dan longitude titik-titik pertama
+    lat2, lon2: numpy.ndarray
+        Latitude dan longitude titik-titik kedua (ukuran sama / bisa di-broadcast)
+
+    Return
+    ------
+    d: numpy.ndarray
+        Jarak setiap pasangan titik dalam satuan meter
+"""
+def measure_haversine(lat1, lon1, lat2, lon2):
     # radius Bumi dalam KM
     R = 6378.137
 
-    dLat = math.radians(lat2 - lat1)
-    dLon = math.radians(lon2 - lon1)
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    dLat = lat2 - lat1
+    dLon = lon2 - lon1
 
     a = (
-        math.sin(dLat / 2) ** 2 +
-        math.cos(math.radians(lat1)) *
-        math.cos(math.radians(lat2)) *
-        math.sin(dLon / 2) ** 2
+        np.sin(dLat / 2) ** 2 +
+        np.cos(lat1) *
+        np.cos(lat2) *
+        np.sin(dLon / 2) ** 2
     )
 
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
     d = R * c
     return d * 1000  # ubah jadi meter
 
+"""
+Menentukan CRS UTM (EPSG WGS 84 / UTM) untuk suatu koordinat.
+    Parameter
+    ---------
+    lon: float
+        Longitude acuan
+    lat: float
+        Latitude acuan
+
+    Return
+    ------
+    crs: str
+        Kode EPSG zona UTM, misal "EPSG:32748" untuk area studi
+"""
+def utm_crs(lon, lat):
+    zone = int((lon + 180) // 6) % 60 + 1
+    return f"EPSG:{32600 + zone if lat >= 0 else 32700 + zone}"
 
 """
-Mencari pasangan index dari dua garis pantai berdasarkan kesamaan longitude.
+Menghitung jarak banyak pasangan koordinat sekaligus pada proyeksi UTM (meter).
+    Parameter
+    ---------
+    lat1, lon1: numpy.ndarray
+        Latitude dan longitude titik-titik pertama
+    lat2, lon2: numpy.ndarray
+        Latitude dan longitude titik-titik kedua (ukuran sama)
+    crs: str
+        CRS proyeksi tujuan (default None = zona UTM dari titik tengah data)
+
+    Return
+    ------
+    d: numpy.ndarray
+        Jarak Euclid setiap pasangan titik pada bidang UTM dalam satuan meter
+"""
+def measure_utm(lat1, lon1, lat2, lon2, crs=None):
+    lat1, lon1, lat2, lon2 = (np.asarray(v, dtype=np.float64).ravel() for v in (lat1, lon1, lat2, lon2))
+
+    # proyeksikan kedua kelompok titik dalam satu panggilan
+    xs, ys, _ = project_utm(np.concatenate([lon1, lon2]), np.concatenate([lat1, lat2]), crs)
+    n = len(lon1)
+    return np.hypot(xs[n:] - xs[:n], ys[n:] - ys[:n])
+
+"""
+Proyeksi koordinat (longitude, latitude) ke bidang UTM dalam satuan meter.
+    Parameter
+    ---------
+    lon: numpy.ndarray
+        Longitude titik-titik
+    lat: numpy.ndarray
+        Latitude titik-titik
+    crs: str
+        CRS proyeksi tujuan (default None = zona UTM dari titik tengah data)
+
+    Return
+    ------
+    x, y: numpy.ndarray
+        Koordinat easting dan northing dalam meter
+    crs: str
+        CRS yang dipakai
+"""
+def project_utm(lon, lat, crs=None):
+    lon = np.asarray(lon, dtype=np.float64).ravel()
+    lat = np.asarray(lat, dtype=np.float64).ravel()
+    if crs is None:
+        crs = utm_crs(np.mean(lon), np.mean(lat))
+    x, y = transform_coords("EPSG:4326", crs, lon, lat)
+    return np.asarray(x), np.asarray(y), crs
+
+"""
+Menghitung jarak antar pasangan titik dari dua array koordinat (longitude, latitude).
+    Parameter
+    ---------
+    points_a: numpy.ndarray
+        Array (N, 2) koordinat (longitude, latitude)
+    points_b: numpy.ndarray
+        Array (N, 2) koordinat (longitude, latitude)
+    mode: str
+        "haversine" (default) atau "utm"
+
+    Return
+    ------
+    d: numpy.ndarray
+        Array (N,) jarak setiap pasangan titik dalam satuan meter
+"""
+def measure_points(points_a, points_b, mode="haversine"):
+    points_a = np.asarray(points_a, dtype=np.float64).reshape(-1, 2)
+    points_b = np.asarray(points_b, dtype=np.float64).reshape(-1, 2)
+    if mode == "haversine":
+        return measure_haversine(points_a[:, 1], points_a[:, 0], points_b[:, 1], points_b[:, 0])
+    if mode == "utm":
+        return measure_utm(points_a[:, 1], points_a[:, 0], points_b[:, 1], points_b[:, 0])
+    raise ValueError(f"mode jarak tidak dikenal: {mode}")
+
+
+"""
+Membuat spatial index (KD-tree) untuk 1 garis pantai.
+Longitude diskalakan dengan cos(latitude) agar jarak di ruang index mendekati
+jarak sebenarnya di permukaan bumi.
+    Parameters
+    -----------
+    line: np.array
+        Array koordinat garis pantai (longitude, latitude)
+
+    Returns
+    --------
+    index: tuple
+        (cKDTree, skala) untuk dipakai pada find_index_pair
+"""
+def build_line_index(line):
+    line = np.asarray(line, dtype=np.float64)
+    scale = np.array([np.cos(np.radians(np.mean(line[:, 1]))), 1.0])
+    return cKDTree(line * scale), scale
+
+"""
+Mencari pasangan index dari dua garis pantai berdasarkan titik terdekat (2D).
     Parameters
     -----------
     first_line: np.array
@@ -371,27 +811,26 @@ Mencari pasangan index dari dua garis pantai berdasarkan kesamaan longitude.
         Array koordinat garis pantai terakhir (longitude, latitude)
     num_samples: int
         Jumlah sampel yang ingin diambil
+    last_index: tuple
+        Hasil build_line_index(last_line) yang sudah ada (default None = dibuat baru)
 
     Returns
     --------
     matched_indices: list of tuples
         List berisi tuple (idx_first, idx_last) yang merupakan pasangan index
 """
-def find_index_pair(first_line, last_line, num_samples=5):
+def find_index_pair(first_line, last_line, num_samples=5, last_index=None):
+    if last_index is None:
+        last_index = build_line_index(last_line)
+    tree, scale = last_index
 
     # sampling index dari garis pertama
     sample_indices_first = np.linspace(0, len(first_line)-1, num_samples).astype(int)
-    matched_indices = []
-    for idx_first in sample_indices_first:
-        lon_first = first_line[idx_first, 0]
 
-        # cari index pada garis terakhir yang memiliki longitude terdekat
-        lon_differences = np.abs(last_line[:, 0] - lon_first)
-        idx_last = np.argmin(lon_differences)
+    # cari titik terdekat pada garis terakhir untuk semua sampel sekaligus
+    _, idx_last = tree.query(np.asarray(first_line)[sample_indices_first] * scale)
 
-        matched_indices.append((idx_first, idx_last))
-
-    return matched_indices
+    return list(zip(sample_indices_first.tolist(), idx_last.tolist()))
 
 """
 Menghitung jarak antara dua garis pantai dan memplotnya.
@@ -403,24 +842,25 @@ Menghitung jarak antara dua garis pantai dan memplotnya.
         List dengan key "mean_coastline"
     num_samples: int
         Berapa banyak garis jarak yang ingin ditampilkan (default 8)
+    out_dir: str
+        Folder tujuan gambar (default COMPARE_DIR)
 """
-def plot_coastline_distances(method, data, num_samples=8):
+def plot_coastline_distances(method, data, num_samples=8, out_dir=COMPARE_DIR):
     # ambil garis pertama dan terakhir
     first = np.array(data[0]["coastline"])
     last  = np.array(data[-1]["coastline"])
 
     # cari pasangan index yang sesuai
-    matched_indices = find_index_pair(first, last, num_samples)
+    matched_indices = find_index_pair(first, last, num_samples, data[-1].get("index"))
 
-    # hitung jarak untuk setiap pasangan titik
-    distances = []
-    for idx_first, idx_last in matched_indices:
-        dist = measure(first[idx_first, 1], first[idx_first, 0],
-                      last[idx_last, 1], last[idx_last, 0])
-        distances.append(dist)
+    # hitung jarak untuk semua pasangan titik sekaligus
+    idx_first_all, idx_last_all = np.array(matched_indices).T
+    distances = measure_points(first[idx_first_all], last[idx_last_all])
 
     # buat plot gabungan
-    plt.figure(figsize=(10, 8))
+    # (Figure tanpa pyplot agar aman dijalankan beberapa request sekaligus di thread berbeda)
+    fig = Figure(figsize=(10, 8))
+    ax = fig.add_subplot()
 
     # atur palet warna dan gradasi
     cmap = plt.get_cmap('Blues')
@@ -429,7 +869,7 @@ def plot_coastline_distances(method, data, num_samples=8):
     # plot setiap garis pantai
     for i in range (len(data)):
       coastline = data[i]['coastline']
-      plt.plot(coastline[:, 0], coastline[:, 1],
+      ax.plot(coastline[:, 0], coastline[:, 1],
                linewidth=2,
                color=coastline_colors[i],
                label=f"Garis Pantai {data[i]['group_name']}")
@@ -439,28 +879,27 @@ def plot_coastline_distances(method, data, num_samples=8):
         x_vals = [first[idx_first, 0], last[idx_last, 0]]
         y_vals = [first[idx_first, 1], last[idx_last, 1]]
 
-        plt.plot(x_vals, y_vals, '--', linewidth=1.5, color='black', alpha=0.7)
+        ax.plot(x_vals, y_vals, '--', linewidth=1.5, color='black', alpha=0.7)
 
         # penambahan marker pada titik yang sudah dibuat
-        plt.plot(first[idx_first, 0], first[idx_first, 1], 'bo', markersize=6)
-        plt.plot(last[idx_last, 0], last[idx_last, 1], 'ro', markersize=6)
+        ax.plot(first[idx_first, 0], first[idx_first, 1], 'bo', markersize=6)
+        ax.plot(last[idx_last, 0], last[idx_last, 1], 'ro', markersize=6)
 
         # background putih untuk teks jarak
-        plt.text(x_vals[1], y_vals[0], f"{distances[idx]:.2f} m",
+        ax.text(x_vals[1], y_vals[0], f"{distances[idx]:.2f} m",
                 fontsize=9, ha='center',
                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
 
-    plt.title("Jarak Antar Garis Pantai", fontsize=14)
-    plt.legend(loc='upper left', bbox_to_anchor=(1.05, 1), fontsize=10)
-    plt.xlabel("Longitude", fontsize=11)
-    plt.ylabel("Latitude", fontsize=11)
+    ax.set_title("Jarak Antar Garis Pantai", fontsize=14)
+    ax.legend(loc='upper left', bbox_to_anchor=(1.05, 1), fontsize=10)
+    ax.set_xlabel("Longitude", fontsize=11)
+    ax.set_ylabel("Latitude", fontsize=11)
 
     # save plot
     if(method == "all"):
-        plt.savefig(f'../web_app/static/assets/compare/predictionAll.png', dpi=300, bbox_inches='tight')
+        fig.savefig(os.path.join(out_dir, "predictionAll.png"), dpi=300, bbox_inches='tight')
     elif(method == "avg"):
-        plt.savefig(f'../web_app/static/assets/compare/predictionAvg.png', dpi=300, bbox_inches='tight')
-    # plt.show()
+        fig.savefig(os.path.join(out_dir, "predictionAvg.png"), dpi=300, bbox_inches='tight')
 
 """
 Menghasilkan plot perbandingan garis pantai berdasarkan tahun yang dipilih.
@@ -470,28 +909,25 @@ Menghasilkan plot perbandingan garis pantai berdasarkan tahun yang dipilih.
         Tahun awal untuk perbandingan
     endYear: int 
         Tahun akhir untuk perbandingan 
-    coastlines_all: list of dictionaries 
-        List dari hasil pembuatan garis pantai dan informasi lainnya
+    catalog: CoastlineCatalog
+        Katalog garis pantai hasil init_result()
+    out_dir: str
+        Folder tujuan gambar (default COMPARE_DIR)
 """
-def generate_coastline_compare_new(startYear, endYear, coastlines_all):
-    chosenYear = range(startYear, endYear + 1)
-    filtered_coastlines = []
-
+def generate_coastline_compare_new(startYear, endYear, catalog, out_dir=COMPARE_DIR):
     # filter data sesuai tahun yang dipilih
-    for year in chosenYear:
-        for c in coastlines_all:
-            if(c["year"] == year):
-                filtered_coastlines.append({
-                    "year": c["year"],
-                    "period": c["period"],
-                    "group_name": c["group_name"],
-                    "mask": c["mask"],
-                    "transform": c["transform"],
-                    "coastline": interpolate_line(c["coastline"][0], num_points=1000),
-                    "plot": c["plot"]
-                })
+    chosen = catalog.year_slice(startYear, endYear)
+    filtered_coastlines = [
+        {"group_name": group_name, "coastline": line}
+        for group_name, line in zip(catalog.group_names[chosen], catalog.lines[chosen])
+    ]
+
+    # spatial index garis terakhir dipakai ulang antar request
+    if filtered_coastlines:
+        filtered_coastlines[-1]["index"] = catalog.line_index(chosen.stop - 1)
+
     # plot garis pantai dan jarak antar garis pantai
-    plot_coastline_distances("all", filtered_coastlines, num_samples=8)
+    plot_coastline_distances("all", filtered_coastlines, num_samples=8, out_dir=out_dir)
 
 """
 Menghitung dan memplot rata-rata garis pantai untuk kelompok tahun tertentu.
@@ -501,36 +937,21 @@ Menghitung dan memplot rata-rata garis pantai untuk kelompok tahun tertentu.
         Tahun awal untuk perbandingan
     endYear: int 
         Tahun akhir untuk perbandingan 
-    coastlines_all: list of dictionaries 
-        List dari hasil pembuatan garis pantai dan informasi lainnya
-    num_points: int 
-        Banyaknya point untuk proses interpolasi (default 1000)
+    catalog: CoastlineCatalog
+        Katalog garis pantai hasil init_result()
+    out_dir: str
+        Folder tujuan gambar (default COMPARE_DIR)
 """
-def generate_coastline_compare_average(startYear, endYear, coastlines_all, num_points=1000):
-    chosenYear = range(startYear, endYear + 1)
-    year_group = {}
+def generate_coastline_compare_average(startYear, endYear, catalog, out_dir=COMPARE_DIR):
     avg_coastlines = []
-    year_start = startYear
-    year_end = endYear + 1
-    increment = 1
-
-    # buat kelompok tahun
-    while (year_start < year_end):
-        now = int(year_start + increment - 1)
-        year_group[f'{year_start}'] = [y for y in chosenYear if y >= year_start and y <= now]
-        year_start = int(now + 1)
-
-    # hitung rata-rata garis pantai untuk setiap kelompok tahun
-    for group_name, group_years in year_group.items():
-        coastlines = []
-        for c in coastlines_all:
-            if(c["year"] in group_years):
-                coastlines.append(interpolate_line(c["coastline"][0], num_points))
-        mean_coastline = np.mean(coastlines, axis=0)
+
+    # hitung rata-rata garis pantai untuk setiap tahun
+    for year in range(startYear, endYear + 1):
+        mean_coastline = np.mean(catalog.lines[catalog.year_slice(year, year)], axis=0)
         avg_coastlines.append({
-            "group_name": group_name,
+            "group_name": f"{year}",
             "coastline": mean_coastline
         })
     
     # plot garis pantai dan jarak antar garis pantai
-    plot_coastline_distances("avg", avg_coastlines, num_samples=8)
\ No newline at end of file
+    plot_coastline_distances("avg", avg_coastlines, num_samples=8, out_dir=out_dir)
\ No newline at end of file
@@ -0,0 +1,207 @@
+import os
+import time
+import random
+import requests
+import numpy as np
+import rasterio
+from requests.adapters import HTTPAdapter
+
+# session HTTP bersama agar koneksi ke server download dipakai ulang antar request
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# status HTTP sementara yang dicoba ulang
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+"""
+Download file secara streaming ke disk, dengan retry dan backoff eksponensial
+untuk gangguan jaringan dan status HTTP sementara
+    Parameters
+    ----------
+    url: str
+        URL file
+    out_path: str
+        Path tujuan. File ditulis ke path sementara lalu di-rename,
+        sehingga tidak ada file setengah jadi jika download gagal
+    retries: int
+        Banyaknya percobaan (default 4)
+    backoff: float
+        Jeda awal antar percobaan dalam detik, dikali 2 setiap percobaan (default 0.5)
+    timeout: float
+        Timeout koneksi dan baca dalam detik (default 60)
+    chunk_size: int
+        Ukuran potongan yang ditulis ke disk (default 64 KiB)
+
+    Returns
+    -------
+    out_path: str
+        Path file hasil download
+"""
+def download_file(url, out_path, retries=4, backoff=0.5, timeout=60, chunk_size=1 << 16):
+    tmp_path = f"{out_path}.part"
+    for attempt in range(retries):
+        try:
+            with _session.get(url, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+            os.replace(tmp_path, out_path)
+            return out_path
+        except requests.RequestException as e:
+            # error client (selain 429) tidak akan berhasil jika diulang
+            status = e.response.status_code if e.response is not None else None
+            if attempt == retries - 1 or (status is not None and status not in RETRY_STATUS):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+"""
+Tidak ada citra untuk sensor / rentang tanggal yang diminta
+"""
+class ImageryNotFound(Exception):
+    pass
+
+"""
+Dasar semua provider citra. Provider mengambil hasil klasifikasi 1 sensor
+pada rentang tanggal tertentu dan menyimpannya sebagai GeoTIFF.
+"""
+class ImageryProvider:
+    name = None
+
+    """
+    Mengambil hasil klasifikasi dan menyimpannya ke out_path
+        Parameters
+        ----------
+        sensor: str
+            Nama sensor ("sentinel" atau "landsat")
+        startDate: str
+            Tanggal mulai (YYYY-MM-DD)
+        endDate: str
+            Tanggal akhir (YYYY-MM-DD)
+        build_classified: function
+            build_classified(startDate, endDate) dari modul model sensor,
+            mengembalikan (ee.Image klasifikasi, GeoJSON area studi)
+        out_path: str
+            Path GeoTIFF hasil
+
+        Returns
+        -------
+        out_path: str
+            Path GeoTIFF hasil
+    """
+    def fetch(self, sensor, startDate, endDate, build_classified, out_path):
+        raise NotImplementedError
+
+"""
+Provider Earth Engine: klasifikasi dijalankan di server GEE lalu hasilnya di-download
+"""
+class EarthEngineProvider(ImageryProvider):
+    name = "earthengine"
+
+    def fetch(self, sensor, startDate, endDate, build_classified, out_path):
+        classified, region = build_classified(startDate, endDate)
+
+        # region berupa GeoJSON lokal, tidak perlu getInfo ke server
+        url = classified.toUint8().getDownloadURL({
+            'region': region,
+            'scale': 30,
+            'crs': 'EPSG:4326',
+            'format': 'GEO_TIFF'
+        })
+
+        # download prediksi dalam format GeoTIFF (uint8, 0 darat / 1 air)
+        return download_file(url, out_path)
+
+"""
+Provider lokal pengganti Earth Engine untuk benchmark dan pengujian offline.
+Citra diambil dari GeoTIFF klasifikasi yang sudah disiapkan (default arsip
+modules/SENTINEL2 dan modules/LANDSAT8), dipilih yang periodenya paling dekat
+dengan rentang tanggal, lalu ditulis dalam format yang sama dengan hasil download GEE
+(kelas uint8 1 band).
+    Parameters
+    ----------
+    sources: list of dictionary
+        GeoTIFF yang disiapkan, format sama dengan combine_hasil.list_sources()
+        (default None = semua arsip)
+    latency: float
+        Jeda buatan per request dalam detik (default 0)
+    jitter: float
+        Tambahan jeda acak maksimum dalam detik (default 0)
+"""
+class LocalImageryProvider(ImageryProvider):
+    name = "local"
+
+    def __init__(self, sources=None, latency=0.0, jitter=0.0):
+        if sources is None:
+            from .combine_hasil import list_sources
+            sources = [s for s in list_sources() if os.path.exists(s["filepath"])]
+        self.sources = sources
+        self.latency = latency
+        self.jitter = jitter
+
+    """
+    Memilih GeoTIFF sensor yang titik tengah periodenya paling dekat dengan rentang tanggal
+    """
+    def select_source(self, sensor, startDate, endDate):
+        from .shoreline_change import decimal_years
+
+        candidates = [s for s in self.sources if s["sensor"] == sensor]
+        if not candidates:
+            raise ImageryNotFound(f"tidak ada citra lokal untuk sensor {sensor}")
+
+        # titik tengah rentang tanggal dalam tahun desimal
+        start, end = np.datetime64(startDate, "D"), np.datetime64(endDate, "D")
+        middle = start + (end - start) // 2
+        year = middle.astype("datetime64[Y]")
+        target = 1970 + year.astype(int) + (middle - year).astype(int) / 365.25
+
+        dates = decimal_years([s["year"] for s in candidates], [s["period"] for s in candidates])
+        return candidates[int(np.argmin(np.abs(dates - target)))]
+
+    def fetch(self, sensor, startDate, endDate, build_classified, out_path):
+        source = self.select_source(sensor, startDate, endDate)
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        # tulis ulang sebagai kelas uint8 1 band, sama seperti hasil download GEE
+        with rasterio.open(source["filepath"]) as src:
+            classes = (src.read(1) == 1).astype(np.uint8)
+            profile = src.profile.copy()
+
+        profile.update(driver='GTiff', count=1, dtype='uint8', nodata=None)
+        with rasterio.open(out_path, 'w', **profile) as dst:
+            dst.write(classes, 1)
+        return out_path
+
+_provider = None
+
+"""
+Provider citra yang dipakai modul model, dipilih dari environment variable
+IMAGERY_PROVIDER ("earthengine" default, atau "local"). Provider lokal membaca
+IMAGERY_LATENCY dan IMAGERY_JITTER (detik) untuk jeda buatan.
+    Returns
+    -------
+    provider: ImageryProvider
+"""
+def get_provider():
+    global _provider
+    if _provider is None:
+        if os.environ.get("IMAGERY_PROVIDER", "earthengine") == "local":
+            _provider = LocalImageryProvider(latency=float(os.environ.get("IMAGERY_LATENCY", 0)),
+                                             jitter=float(os.environ.get("IMAGERY_JITTER", 0)))
+        else:
+            _provider = EarthEngineProvider()
+    return _provider
+
+"""
+Mengganti provider citra (misal provider lokal untuk benchmark)
+    Parameters
+    ----------
+    provider: ImageryProvider
+        Provider baru, None = pilih ulang dari environment variable
+"""
+def set_provider(provider):
+    global _provider
+    _provider = provider
@@ -0,0 +1,93 @@
+import time
+import uuid
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+"""
+Error dengan pesan yang boleh ditampilkan langsung ke pengguna
+"""
+class JobError(Exception):
+    pass
+
+"""
+Antrean job di background dengan worker pool terbatas. Setiap job mendapat id,
+status (queued / running / done / error), tahap yang sedang berjalan, dan hasilnya.
+    Parameters
+    ----------
+    max_workers: int
+        Banyaknya job yang berjalan bersamaan (default 2)
+    max_jobs: int
+        Banyaknya job yang disimpan, job selesai paling lama dibuang lebih dulu (default 200)
+"""
+class JobQueue:
+    def __init__(self, max_workers=2, max_jobs=200):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    """
+    Menjalankan func(report, *args, **kwargs) di background
+        Parameters
+        ----------
+        func: function
+            Function job. report(stage) dipanggil untuk memperbarui tahap job,
+            nilai return disimpan sebagai hasil job. JobError ditampilkan apa adanya.
+
+        Returns
+        -------
+        job_id: str
+            Id job untuk status()
+    """
+    def submit(self, func, *args, **kwargs):
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                "id": job_id,
+                "status": "queued",
+                "stage": "menunggu antrean",
+                "result": None,
+                "error": None,
+                "created": time.time(),
+                "finished": None
+            }
+            self._prune()
+        self._executor.submit(self._run, job_id, func, args, kwargs)
+        return job_id
+
+    """
+    Salinan status 1 job, None jika id tidak dikenal
+    """
+    def status(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _run(self, job_id, func, args, kwargs):
+        self._update(job_id, status="running", stage="mulai")
+        try:
+            result = func(lambda stage: self._update(job_id, stage=stage), *args, **kwargs)
+        except JobError as e:
+            self._update(job_id, status="error", error=str(e), finished=time.time())
+        except Exception:
+            traceback.print_exc()
+            self._update(job_id, status="error", error="Terjadi kesalahan saat memproses permintaan.",
+                         finished=time.time())
+        else:
+            self._update(job_id, status="done", stage="selesai", result=result, finished=time.time())
+
+    # buang job selesai paling lama jika jumlah job melebihi max_jobs
+    def _prune(self):
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = sorted((j for j in self._jobs.values() if j["finished"] is not None),
+                          key=lambda j: j["finished"])
+        for job in finished[:excess]:
+            del self._jobs[job["id"]]
@@ -0,0 +1,193 @@
+import numpy as np
+import rasterio
+from rasterio.warp import transform as transform_coords
+from rasterio.windows import Window
+from sklearn.ensemble import RandomForestClassifier
+from . import training_data
+from .coastline import iter_tiles
+
+# band input setiap sensor, sama dengan sentinel_model.bands dan landsat_model.bands
+# (disalin agar modul ini tidak meng-import earthengine)
+SENSOR_BANDS = {
+    "sentinel": ['B5', 'B6', 'B7', 'B8', 'B11', 'NDWI'],
+    "landsat": ['B4', 'B5', 'B6', 'B7', 'B8', 'B10', 'B11', 'NDWI']
+}
+NUM_TREES = 50
+SEED = 42
+
+"""
+Mencari nomor band (1-based) pada GeoTIFF band stack hasil export
+    Parameters
+    ----------
+    src: rasterio.DatasetReader
+        Band stack yang sudah dibuka
+    bands: list of str
+        Nama band yang dibutuhkan classifier
+
+    Returns
+    -------
+    indexes: list of int
+        Nomor band sesuai urutan bands. Dicocokkan lewat deskripsi band,
+        jika deskripsi kosong dianggap urutan band stack sama dengan bands.
+"""
+def band_indexes(src, bands):
+    descriptions = list(src.descriptions)
+    if all(b in descriptions for b in bands):
+        return [descriptions.index(b) + 1 for b in bands]
+    if src.count < len(bands):
+        raise ValueError(f"band stack hanya berisi {src.count} band, dibutuhkan {len(bands)} ({bands})")
+    return list(range(1, len(bands) + 1))
+
+"""
+Mengambil nilai band stack pada titik training sebuah sensor
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    stack_path: str
+        Path GeoTIFF band stack
+
+    Returns
+    -------
+    X: numpy.ndarray
+        Array (n, n_band) nilai band pada titik yang berada di dalam raster dan valid
+    y: numpy.ndarray
+        Array (n,) kelas titik (1 air / 0 darat)
+"""
+def sample_training_points(sensor, stack_path):
+    points = training_data.load_training_array(sensor)
+    bands = SENSOR_BANDS[sensor]
+
+    with rasterio.open(stack_path) as src:
+        indexes = band_indexes(src, bands)
+        lon, lat = points[:, 0], points[:, 1]
+        if src.crs is not None and src.crs.to_epsg() != 4326:
+            lon, lat = transform_coords("EPSG:4326", src.crs, lon, lat)
+            lon, lat = np.asarray(lon), np.asarray(lat)
+
+        # buang titik di luar raster sebelum sampling
+        cols, rows = ~src.transform * (lon, lat)
+        inside = (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+        X = np.ma.array(list(src.sample(zip(lon[inside], lat[inside]), indexes=indexes, masked=True)))
+
+    # band stack integer (misal Sentinel-2 SR uint16) diubah ke float32 dulu agar bisa diisi NaN
+    y = points[inside, 2].astype(np.uint8)
+    X = X.astype(np.float32).filled(np.nan).reshape(len(y), len(indexes))
+    valid = np.isfinite(X).all(axis=1)
+    return X[valid], y[valid]
+
+"""
+Melatih random forest lokal dari band stack (dibuat sekali, lalu di-cache)
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    stack_path: str
+        Path GeoTIFF band stack untuk mengambil nilai titik training
+    num_trees: int
+        Banyaknya tree (default NUM_TREES)
+    seed: int
+        Seed random forest dan split train / test (default SEED)
+
+    Returns
+    -------
+    model: sklearn.ensemble.RandomForestClassifier
+        Model yang sudah di-train dengan 80% titik, atribut test_accuracy_
+        berisi akurasi pada 20% titik sisanya. Split ini dibuat dengan numpy,
+        berbeda dengan randomColumn('random', seed=42) di Earth Engine, sehingga
+        test_accuracy_ tidak bisa dibandingkan langsung dengan akurasi model GEE.
+"""
+def init_local_model(sensor, stack_path, num_trees=NUM_TREES, seed=SEED):
+    def train():
+        X, y = sample_training_points(sensor, stack_path)
+        if len(y) == 0:
+            raise ValueError(f"tidak ada titik training {sensor} di dalam {stack_path}")
+
+        # split menjadi train dan test set (80% train, 20% test)
+        # (titik test tidak sama dengan split randomColumn di Earth Engine)
+        is_train = np.random.default_rng(seed).random(len(y)) < 0.8
+        model = RandomForestClassifier(n_estimators=num_trees, random_state=seed, n_jobs=-1)
+        model.fit(X[is_train], y[is_train])
+        model.test_accuracy_ = model.score(X[~is_train], y[~is_train]) if (~is_train).any() else np.nan
+        return model
+
+    bands = SENSOR_BANDS[sensor]
+    return training_data.get_classifier(sensor, bands, num_trees, seed, train, source=("local", stack_path))
+
+"""
+Klasifikasi band stack GeoTIFF per tile, hasilnya raster 0 / 1 1 band
+    Parameters
+    ----------
+    model: sklearn.ensemble.RandomForestClassifier
+        Hasil init_local_model
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    stack_path: str
+        Path GeoTIFF band stack
+    out_path: str
+        Path GeoTIFF hasil klasifikasi (uint8, 1 air / 0 darat)
+    tile_size: int
+        Ukuran tile yang diprediksi sekaligus (default 512)
+
+    Returns
+    -------
+    out_path: str
+        Path GeoTIFF hasil klasifikasi
+"""
+def classify_geotiff(model, sensor, stack_path, out_path, tile_size=512):
+    with rasterio.open(stack_path) as src:
+        indexes = band_indexes(src, SENSOR_BANDS[sensor])
+        profile = src.profile.copy()
+        profile.update(driver='GTiff', count=1, dtype='uint8', nodata=None)
+
+        with rasterio.open(out_path, 'w', **profile) as dst:
+            for window, _ in iter_tiles(src.height, src.width, tile_size):
+                stack = src.read(indexes, window=window, masked=True)
+                h, w = stack.shape[1:]
+
+                # 1 baris per piksel, prediksi hanya piksel valid (sisanya darat)
+                # (float32 dulu agar band stack integer bisa diisi NaN)
+                X = stack.astype(np.float32).filled(np.nan).reshape(len(indexes), -1).T
+                valid = np.isfinite(X).all(axis=1)
+                classes = np.zeros(h * w, dtype=np.uint8)
+                if valid.any():
+                    classes[valid] = model.predict(X[valid])
+                dst.write(classes.reshape(h, w), 1, window=Window(window.col_off, window.row_off, w, h))
+    return out_path
+
+"""
+Train (jika belum ada di cache) lalu klasifikasi 1 band stack
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    stack_path: str
+        Path GeoTIFF band stack yang diklasifikasi
+    out_path: str
+        Path GeoTIFF hasil klasifikasi
+    train_path: str
+        Path band stack untuk training (default None = stack_path)
+
+    Returns
+    -------
+    out_path: str
+        Path GeoTIFF hasil klasifikasi, bisa langsung dipakai
+        coastline.extract_coastline_from_geotiff
+"""
+def predict_local(sensor, stack_path, out_path, train_path=None):
+    model = init_local_model(sensor, train_path or stack_path)
+    return classify_geotiff(model, sensor, stack_path, out_path)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Klasifikasi band stack GeoTIFF dengan random forest lokal")
+    parser.add_argument("sensor", choices=sorted(SENSOR_BANDS))
+    parser.add_argument("stack", help="GeoTIFF band stack yang diklasifikasi")
+    parser.add_argument("out", help="GeoTIFF hasil klasifikasi")
+    parser.add_argument("--train", default=None, help="band stack untuk training (default sama dengan stack)")
+    args = parser.parse_args()
+
+    model = init_local_model(args.sensor, args.train or args.stack)
+    print(f"akurasi test: {model.test_accuracy_:.3f}")
+    classify_geotiff(model, args.sensor, args.stack, args.out)
@@ -0,0 +1,185 @@
+import os
+import time
+import uuid
+import shutil
+import threading
+
+"""
+Folder hasil per request / job di bawah 1 root, dengan penghapusan otomatis:
+folder yang tidak diakses lebih dari ttl detik dihapus, lalu folder yang paling
+lama tidak diakses (LRU) dihapus sampai total ukuran di bawah max_bytes.
+Waktu akses disimpan sebagai mtime folder sehingga berlaku juga antar process.
+    Parameters
+    ----------
+    root: str
+        Folder induk semua hasil
+    max_bytes: int
+        Kuota total ukuran hasil dalam byte (default 500 MB)
+    ttl: float
+        Umur maksimum sejak akses terakhir dalam detik (default 24 jam, None = tanpa batas)
+    min_age: float
+        Folder yang diakses kurang dari min_age detik lalu tidak dihapus
+        walaupun kuota terlampaui, agar hasil yang baru dibuat masih bisa dilihat (default 60)
+"""
+class OutputStore:
+    def __init__(self, root, max_bytes=500 * 1024 ** 2, ttl=24 * 3600, min_age=60):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.min_age = min_age
+        self._active = set()
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    """
+    Membuat folder hasil baru (menjalankan evict lebih dulu)
+        Returns
+        -------
+        key: str
+            Nama folder hasil
+        path: str
+            Path folder hasil
+    """
+    def create(self):
+        self.evict()
+        key = uuid.uuid4().hex
+        path = os.path.join(self.root, key)
+        with self._lock:
+            os.makedirs(path)
+            self._active.add(key)
+        return key, path
+
+    """
+    Menandai folder selesai ditulis, sejak itu boleh dihapus evict
+    """
+    def release(self, key):
+        with self._lock:
+            self._active.discard(key)
+        self.touch(key)
+
+    """
+    Memperbarui waktu akses folder, return False jika folder sudah dihapus
+    """
+    def touch(self, key):
+        try:
+            os.utime(os.path.join(self.root, key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    """
+    Menghapus folder kedaluwarsa, lalu folder LRU sampai total ukuran di bawah kuota
+        Returns
+        -------
+        removed: list of str
+            Nama folder yang dihapus
+    """
+    def evict(self):
+        now = time.time()
+        entries = []
+        with os.scandir(self.root) as it:
+            for entry in it:
+                # lewati folder sementara (.tmp-*) dan folder yang sedang dihapus (.del-*)
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                # folder bisa di-rename / dihapus thread lain selama scan, anggap sudah dihapus
+                try:
+                    accessed = entry.stat().st_mtime
+                    size = self._size(entry.path)
+                except FileNotFoundError:
+                    continue
+                entries.append((accessed, size, entry.name))
+
+        removed = []
+        total = sum(size for _, size, _ in entries)
+        with self._lock:
+            # urutkan dari yang paling lama tidak diakses
+            for accessed, size, key in sorted(entries):
+                age = now - accessed
+                if key in self._active or age < self.min_age:
+                    continue
+                if (self.ttl is not None and age > self.ttl) or total > self.max_bytes:
+                    # rename dulu agar folder hilang sekaligus, tidak terbaca setengah terhapus
+                    trash = os.path.join(self.root, f".del-{uuid.uuid4().hex}")
+                    try:
+                        os.rename(os.path.join(self.root, key), trash)
+                    except OSError:
+                        continue
+                    shutil.rmtree(trash, ignore_errors=True)
+                    total -= size
+                    removed.append(key)
+        return removed
+
+    # total ukuran file dalam 1 folder, FileNotFoundError jika folder hilang selama dihitung
+    # (os.walk sendiri melewati subfolder yang hilang tanpa error)
+    def _size(self, path):
+        size = 0
+        for dirpath, _, filenames in os.walk(path):
+            for f in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, f))
+                except FileNotFoundError:
+                    pass
+        if not os.path.isdir(path):
+            raise FileNotFoundError(path)
+        return size
+
+"""
+Cache hasil berbasis disk dengan key tetap (bukan per request), dihapus LRU
+jika total ukuran melebihi kuota. Entry ditulis ke folder sementara lalu di-rename,
+dan baru dianggap ada setelah file penanda COMPLETE ditulis.
+    Parameters
+    ----------
+    root: str
+        Folder induk cache
+    max_bytes: int
+        Kuota total ukuran cache dalam byte (default 200 MB)
+    min_age: float
+        Entry yang diakses kurang dari min_age detik lalu tidak dihapus (default 60)
+"""
+class ResultCache(OutputStore):
+    COMPLETE = ".complete"
+
+    def __init__(self, root, max_bytes=200 * 1024 ** 2, min_age=60):
+        super().__init__(root, max_bytes=max_bytes, ttl=None, min_age=min_age)
+
+    """
+    Path folder entry jika ada di cache (sekaligus memperbarui waktu aksesnya), None jika tidak ada
+    """
+    def get(self, key):
+        path = os.path.join(self.root, key)
+        if os.path.exists(os.path.join(path, self.COMPLETE)) and self.touch(key):
+            return path
+        return None
+
+    """
+    Menyalin isi folder src_dir ke cache dengan key tertentu
+        Parameters
+        ----------
+        key: str
+            Key entry
+        src_dir: str
+            Folder hasil yang disalin
+
+        Returns
+        -------
+        path: str
+            Path folder entry di cache. Jika key sudah ada (misal ditulis
+            request lain lebih dulu), entry lama yang dipakai.
+    """
+    def put(self, key, src_dir):
+        self.evict()
+        path = self.get(key)
+        if path is not None:
+            return path
+
+        path = os.path.join(self.root, key)
+        tmp_path = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        shutil.copytree(src_dir, tmp_path)
+        open(os.path.join(tmp_path, self.COMPLETE), "w").close()
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # key sudah ditulis request lain
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return path
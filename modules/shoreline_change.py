@@ -0,0 +1,238 @@
+import numpy as np
+from rasterio.warp import transform as transform_coords
+from .combine_hasil import interpolate_line, project_utm
+
+# titik tengah setiap periode dalam pecahan tahun
+PERIOD_MIDPOINT = {
+    "Jan_Jun": 0.25,
+    "Jul_Des": 0.75,
+    "Jan_Mar": 0.125,
+    "Apr_Jun": 0.375,
+    "Jul_Sep": 0.625,
+    "Okt_Des": 0.875
+}
+
+"""
+Konversi tahun dan periode menjadi tahun desimal
+    Parameters
+    ----------
+    years: numpy.ndarray
+        Tahun setiap garis pantai
+    periods: numpy.ndarray
+        Periode setiap garis pantai (misal "Jan_Jun" atau "Jan_Mar")
+
+    Returns
+    -------
+    dates: numpy.ndarray
+        Tahun desimal (tengah periode) setiap garis pantai
+"""
+def decimal_years(years, periods):
+    offsets = np.array([PERIOD_MIDPOINT.get(p, 0.5) for p in periods], dtype=np.float64)
+    return np.asarray(years, dtype=np.float64) + offsets
+
+"""
+Membuat transect tegak lurus baseline dengan jarak antar transect seragam
+    Parameters
+    ----------
+    baseline: numpy.ndarray
+        Array (P, 2) koordinat baseline pada bidang meter (x, y)
+    num_transects: int
+        Banyaknya transect (default 300)
+
+    Returns
+    -------
+    origins: numpy.ndarray
+        Array (T, 2) titik awal transect pada baseline
+    normals: numpy.ndarray
+        Array (T, 2) vektor satuan arah transect (normal kiri baseline,
+        belum tentu ke arah laut, lihat orient_seaward)
+"""
+def cast_transects(baseline, num_transects=300):
+    origins = interpolate_line(baseline, num_transects)
+
+    # arah baseline dari selisih titik tetangga, lalu diputar 90 derajat
+    tangents = np.gradient(origins, axis=0)
+    tangents /= np.linalg.norm(tangents, axis=1, keepdims=True)
+    normals = np.column_stack((-tangents[:, 1], tangents[:, 0]))
+    return origins, normals
+
+"""
+Membalik arah transect yang mengarah ke darat sehingga semua normal mengarah ke laut.
+Baseline berupa 1 garis sehingga laut selalu berada di 1 sisinya: titik sampel di kedua
+sisi baseline (sampai length meter) pada semua transect dicek pada frekuensi laut, lalu
+semua normal dibalik sekaligus jika sisi belakang lebih sering berupa laut. Keputusan
+bersama ini tidak terpengaruh transect di muara / teluk yang kedua sisinya mirip.
+    Parameters
+    ----------
+    origins: numpy.ndarray
+        Array (T, 2) titik awal transect pada bidang meter
+    normals: numpy.ndarray
+        Array (T, 2) vektor satuan arah transect
+    length: float
+        Panjang transect ke masing-masing sisi baseline (meter)
+    crs: str
+        CRS bidang meter origins (UTM)
+    ocean: tuple
+        (ocean_freq, transform, crs) frekuensi laut (0 - 1, atau mask laut biner) acuan,
+        misal CoastlineCatalog.ocean_reference()
+    samples: int
+        Banyaknya titik sampel di setiap sisi (default 20)
+
+    Returns
+    -------
+    normals: numpy.ndarray
+        Array (T, 2) vektor satuan arah transect yang mengarah ke laut
+"""
+def orient_seaward(origins, normals, length, crs, ocean, samples=20):
+    ocean_freq, transform, ocean_crs = ocean
+
+    # titik sampel (T, 2 sisi, samples, 2) di depan (+) dan belakang (-) baseline
+    steps = np.linspace(length / samples, length, samples)
+    sides = np.array([1.0, -1.0])
+    pts = origins[:, None, None, :] + (sides[None, :, None, None] * steps[None, None, :, None]
+                                       * normals[:, None, None, :])
+
+    # koordinat piksel setiap titik pada raster acuan (di luar raster tidak dihitung)
+    x, y = transform_coords(crs, ocean_crs, pts[..., 0].ravel(), pts[..., 1].ravel())
+    cols, rows = ~transform * (np.asarray(x), np.asarray(y))
+    rows, cols = np.floor(rows).astype(int), np.floor(cols).astype(int)
+    inside = (rows >= 0) & (rows < ocean_freq.shape[0]) & (cols >= 0) & (cols < ocean_freq.shape[1])
+    is_ocean = np.zeros(rows.shape, dtype=np.float64)
+    is_ocean[inside] = ocean_freq[rows[inside], cols[inside]]
+
+    # balik semua normal jika sisi belakang lebih sering laut daripada sisi depan
+    front, back = is_ocean.reshape(len(origins), 2, samples).sum(axis=(0, 2))
+    return -normals if back > front else normals
+
+"""
+Memotong semua transect dengan 1 garis pantai sekaligus
+    Parameters
+    ----------
+    origins: numpy.ndarray
+        Array (T, 2) titik awal transect
+    normals: numpy.ndarray
+        Array (T, 2) vektor satuan arah transect
+    length: float
+        Panjang transect ke masing-masing sisi baseline (meter)
+    line: numpy.ndarray
+        Array (M + 1, 2) garis pantai pada bidang meter
+
+    Returns
+    -------
+    positions: numpy.ndarray
+        Array (T,) jarak bertanda titik potong dari baseline sepanjang transect
+        (meter, positif searah normal). NaN jika transect tidak memotong garis.
+        Jika ada beberapa titik potong, diambil yang paling dekat ke baseline.
+"""
+def intersect_transects(origins, normals, length, line):
+    start = origins - length * normals                  # (T, 2)
+    d = 2 * length * normals                            # (T, 2)
+    p = line[:-1]                                       # (M, 2)
+    e = line[1:] - line[:-1]                            # (M, 2)
+
+    # selesaikan start + u * d = p + v * e untuk semua pasangan (transect, segmen)
+    ap = p[None, :, :] - start[:, None, :]              # (T, M, 2)
+    denom = d[:, None, 0] * e[None, :, 1] - d[:, None, 1] * e[None, :, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = (ap[..., 0] * e[None, :, 1] - ap[..., 1] * e[None, :, 0]) / denom
+        v = (ap[..., 0] * d[:, None, 1] - ap[..., 1] * d[:, None, 0]) / denom
+    hit = (denom != 0) & (u >= 0) & (u <= 1) & (v >= 0) & (v <= 1)
+
+    # pilih titik potong yang paling dekat ke baseline
+    offsets = np.where(hit, (u - 0.5) * 2 * length, np.nan)
+    nearest = np.argmin(np.where(hit, np.abs(offsets), np.inf), axis=1)
+    positions = offsets[np.arange(len(origins)), nearest]
+    return positions
+
+"""
+Menghitung statistik perubahan garis pantai (NSM, EPR, LRR) per transect
+    Parameters
+    ----------
+    catalog: CoastlineCatalog
+        Katalog garis pantai (combine_hasil.CoastlineCatalog)
+    num_transects: int
+        Banyaknya transect sepanjang baseline (default 300)
+    length: float
+        Panjang transect ke masing-masing sisi baseline dalam meter (default 500)
+    baseline: numpy.ndarray
+        Array (P, 2) baseline (longitude, latitude), default None = rata-rata semua garis pantai
+    ocean: tuple
+        (ocean_freq, transform, crs) frekuensi laut acuan untuk arah transect,
+        default None = catalog.ocean_reference()
+
+    Returns
+    -------
+    result: dictionary
+        Semua transect mengarah ke laut, sehingga posisi, NSM, EPR, dan LRR
+        positif = garis pantai bergerak ke arah laut (akresi),
+        negatif = garis pantai bergerak ke arah darat (abrasi).
+        origins: (T, 2) titik awal transect (longitude, latitude)
+        dates: (n_lines,) tahun desimal setiap garis pantai
+        positions: (T, n_lines) posisi garis pantai pada setiap transect (meter, positif ke arah laut)
+        nsm: (T,) net shoreline movement (meter)
+        epr: (T,) end point rate (meter/tahun)
+        lrr: (T,) linear regression rate (meter/tahun)
+"""
+def compute_shoreline_change(catalog, num_transects=300, length=500.0, baseline=None, ocean=None):
+    if len(catalog) == 0:
+        raise ValueError("katalog garis pantai kosong")
+    if ocean is None:
+        ocean = catalog.ocean_reference()
+    if ocean is None:
+        raise ValueError("arah laut tidak diketahui, katalog dibuat tanpa mask dan ocean tidak diberikan")
+    if baseline is None:
+        baseline = catalog.lines.mean(axis=0)
+    baseline = np.asarray(baseline, dtype=np.float64)
+
+    # proyeksikan baseline dan semua garis pantai ke UTM dalam 1 panggilan
+    n_lines, n_points = catalog.lines.shape[:2]
+    lon = np.concatenate([baseline[:, 0], catalog.lines[..., 0].ravel()])
+    lat = np.concatenate([baseline[:, 1], catalog.lines[..., 1].ravel()])
+    x, y, crs = project_utm(lon, lat)
+    xy = np.column_stack((x, y))
+    baseline_xy = xy[:len(baseline)]
+    lines_xy = xy[len(baseline):].reshape(n_lines, n_points, 2)
+
+    origins, normals = cast_transects(baseline_xy, num_transects)
+    normals = orient_seaward(origins, normals, length, crs, ocean)
+    positions = np.column_stack([intersect_transects(origins, normals, length, line) for line in lines_xy])
+
+    # urutkan garis pantai berdasarkan waktu
+    dates = decimal_years(catalog.years, catalog.periods)
+    order = np.argsort(dates, kind="stable")
+    dates, positions = dates[order], positions[:, order]
+
+    # NSM dan EPR dari observasi valid pertama dan terakhir setiap transect
+    valid = ~np.isnan(positions)
+    count = valid.sum(axis=1)
+    has_any = count > 0
+    first = np.where(has_any, np.argmax(valid, axis=1), 0)
+    last = np.where(has_any, n_lines - 1 - np.argmax(valid[:, ::-1], axis=1), 0)
+    rows = np.arange(num_transects)
+    nsm = np.where(has_any, positions[rows, last] - positions[rows, first], np.nan)
+    span = dates[last] - dates[first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        epr = np.where(span > 0, nsm / span, np.nan)
+
+    # LRR: kemiringan regresi linear posisi terhadap waktu (hanya observasi valid)
+    t = np.where(valid, dates[None, :], 0.0)
+    s = np.where(valid, positions, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_mean = t.sum(axis=1) / count
+        s_mean = s.sum(axis=1) / count
+        dt = np.where(valid, dates[None, :] - t_mean[:, None], 0.0)
+        ds = np.where(valid, positions - s_mean[:, None], 0.0)
+        lrr = (dt * ds).sum(axis=1) / (dt ** 2).sum(axis=1)
+    lrr = np.where(count >= 2, lrr, np.nan)
+
+    # kembalikan titik awal transect ke koordinat geografis
+    origins_lon, origins_lat = transform_coords(crs, "EPSG:4326", origins[:, 0], origins[:, 1])
+
+    return {
+        "origins": np.column_stack((origins_lon, origins_lat)),
+        "dates": dates,
+        "positions": positions,
+        "nsm": nsm,
+        "epr": epr,
+        "lrr": lrr
+    }
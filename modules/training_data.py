@@ -0,0 +1,183 @@
+import os
+import json
+import hashlib
+import threading
+import numpy as np
+from functools import lru_cache
+
+# titik training setiap sensor disimpan sebagai GeoJSON (1 feature per baris)
+TRAINING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "training_points")
+
+"""
+Membaca titik training 1 sensor (dibaca sekali, lalu di-cache)
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+
+    Returns
+    -------
+    collection: dictionary
+        GeoJSON FeatureCollection. Setiap feature berisi id (system:index),
+        geometry Point (longitude, latitude) dan properties {"Class": 1 air / 0 darat}.
+        Jangan diubah karena dipakai bersama.
+"""
+@lru_cache(maxsize=None)
+def load_training_geojson(sensor):
+    path = os.path.join(TRAINING_DIR, f"{sensor}.geojson")
+    with open(path) as f:
+        return json.load(f)
+
+"""
+Titik training 1 sensor dalam bentuk array untuk model lokal
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+
+    Returns
+    -------
+    points: numpy.ndarray
+        Array (n, 3) berisi longitude, latitude, dan kelas setiap titik
+"""
+def load_training_array(sensor):
+    features = load_training_geojson(sensor)["features"]
+    return np.array([f["geometry"]["coordinates"] + [f["properties"]["Class"]] for f in features],
+                    dtype=np.float64)
+
+"""
+Versi titik training 1 sensor, berubah jika isi file GeoJSON berubah
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+
+    Returns
+    -------
+    version: str
+        sha256 isi file titik training
+"""
+@lru_cache(maxsize=None)
+def training_version(sensor):
+    path = os.path.join(TRAINING_DIR, f"{sensor}.geojson")
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+"""
+Versi model 1 sensor dari parameter classifier dan versi titik training,
+dipakai sebagai bagian key cache hasil prediksi
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    bands: list of str
+        Band input classifier
+    num_trees: int
+        Banyaknya tree random forest
+    seed: int
+        Seed random forest
+
+    Returns
+    -------
+    version: str
+        Hash 16 karakter
+"""
+def model_version(sensor, bands, num_trees, seed):
+    params = f"{sensor}:{','.join(bands)}:{num_trees}:{seed}:{training_version(sensor)}"
+    return hashlib.sha256(params.encode()).hexdigest()[:16]
+
+# classifier yang sudah di-train, dipakai bersama oleh semua request dan thread
+_classifiers = {}
+_classifiers_lock = threading.Lock()
+
+"""
+Mengambil classifier dari cache, atau men-train-nya sekali jika belum ada
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    bands: list of str
+        Band input classifier
+    num_trees: int
+        Banyaknya tree random forest
+    seed: int
+        Seed random forest
+    train: function
+        Function tanpa parameter yang mengembalikan classifier baru
+    source: hashable
+        Pembeda tambahan, misal backend dan data training (default None)
+
+    Returns
+    -------
+    classifier: object
+        Classifier dengan key (sensor, bands, num_trees, seed, training_version, source)
+"""
+def get_classifier(sensor, bands, num_trees, seed, train, source=None):
+    key = (sensor, tuple(bands), num_trees, seed, training_version(sensor), source)
+    with _classifiers_lock:
+        if key not in _classifiers:
+            _classifiers[key] = train()
+        return _classifiers[key]
+
+# task export classifier ke asset Earth Engine yang sudah dimulai di process ini
+_exports = {}
+
+"""
+Classifier Earth Engine yang hasil training-nya disimpan sebagai asset.
+Classifier yang di-train dengan train() hanyalah graph lazy yang di-train ulang di
+server setiap kali dipakai, sehingga hasil training di-export sekali ke asset_id
+(Export.classifier.toAsset) lalu dipakai lewat ee.Classifier.load. Selama export
+belum selesai, classifier hasil train() tetap dipakai.
+    Parameters
+    ----------
+    sensor: str
+        Nama sensor ("sentinel" atau "landsat")
+    bands: list of str
+        Band input classifier
+    num_trees: int
+        Banyaknya tree random forest
+    seed: int
+        Seed random forest
+    asset_id: str
+        Id asset classifier, sebaiknya memuat model_version agar berganti jika model berubah
+    train: function
+        Function tanpa parameter yang mengembalikan ee.Classifier yang sudah di-train
+
+    Returns
+    -------
+    classifier: ee.Classifier
+        Classifier dari asset jika sudah ada, jika belum classifier hasil train()
+"""
+def get_ee_classifier(sensor, bands, num_trees, seed, asset_id, train):
+    import ee
+
+    key = (sensor, tuple(bands), num_trees, seed, training_version(sensor), asset_id)
+    with _classifiers_lock:
+        if key in _classifiers:
+            return _classifiers[key]
+
+    # asset sudah ada: tidak perlu training lagi
+    try:
+        ee.data.getAsset(asset_id)
+    except ee.EEException:
+        pass
+    else:
+        classifier = ee.Classifier.load(asset_id)
+        with _classifiers_lock:
+            _classifiers[key] = classifier
+        return classifier
+
+    # asset belum ada: export sekali per process, sementara pakai classifier hasil train()
+    classifier = train()
+    with _classifiers_lock:
+        start_export = asset_id not in _exports
+        if start_export:
+            _exports[asset_id] = None
+    if start_export:
+        try:
+            task = ee.batch.Export.classifier.toAsset(classifier, f"classifier_{sensor}", asset_id)
+            task.start()
+            _exports[asset_id] = task
+        except ee.EEException as e:
+            print(f"[WARN] Gagal export classifier ke {asset_id}: {e}")
+    return classifier
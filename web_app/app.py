@@ -1,19 +1,94 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, url_for
+import os
 import sys
-from ee.ee_exception import EEException
+import hashlib
+import threading
+import multiprocessing
+from datetime import datetime
+import numpy as np
 sys.path.append("..")
-from modules import sentinel_model
-from modules import landsat_model
+
+# mode offline: dashboard, detail, dan perbandingan hanya memakai data lokal,
+# modul Earth Engine tidak di-import sama sekali (python app.py --offline atau OFFLINE=1)
+OFFLINE = "--offline" in sys.argv or os.environ.get("OFFLINE") == "1"
+from modules import imagery
+
+# prediksi baru butuh Earth Engine, kecuali memakai provider citra lokal (IMAGERY_PROVIDER=local)
+CAN_PREDICT = not OFFLINE or imagery.get_provider().name == "local"
+if CAN_PREDICT:
+    from ee.ee_exception import EEException
+    from modules import sentinel_model
+    from modules import landsat_model
 from modules import coastline
 from modules import combine_hasil
-import pandas as pd
+from modules import area_change
+from modules import jobs
+from modules import output_store
 
 app = Flask(__name__)
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 app.jinja_env.auto_reload = True
 
-df_perubahan = pd.read_csv("hasil_akresi_abrasi_per_tahun.csv")
-coastlines_all, _ = combine_hasil.init_result()
+# katalog garis pantai dan tabel akresi/abrasi, dibuat sekali saat pertama dibutuhkan
+# (berlaku juga untuk flask run, server WSGI, dan test client yang tidak menjalankan __main__)
+_data = None
+_data_lock = threading.Lock()
+
+"""
+Data hasil ekstraksi semua GeoTIFF arsip
+    Returns
+    -------
+    data: dictionary
+        catalog: CoastlineCatalog untuk halaman perbandingan
+        perubahan: pandas.DataFrame tabel akresi/abrasi untuk halaman detail
+"""
+def get_data():
+    global _data
+    # worker process milik init_result (spawn) meng-import ulang modul ini, jangan ekstraksi di sana
+    if multiprocessing.parent_process() is not None:
+        raise RuntimeError("get_data hanya boleh dipanggil dari process utama")
+    with _data_lock:
+        if _data is None:
+            coastlines_all, _ = combine_hasil.init_result()
+            _data = {
+                "catalog": combine_hasil.CoastlineCatalog(coastlines_all),
+                "perubahan": area_change.update_area_change_table(coastlines_all)
+            }
+        return _data
+
+# prediksi dijalankan di background, banyaknya prediksi bersamaan dibatasi PREDICT_WORKERS
+prediction_jobs = jobs.JobQueue(max_workers=int(os.environ.get("PREDICT_WORKERS", 2)))
+
+# hasil prediksi dan perbandingan disimpan per request di static/assets/results,
+# dihapus jika tidak diakses selama OUTPUT_TTL_HOURS atau total ukuran melebihi OUTPUT_QUOTA_MB
+RESULTS_DIR = os.path.join(app.static_folder, "assets", "results")
+OUTPUT_QUOTA = int(os.environ.get("OUTPUT_QUOTA_MB", 500)) * 1024 ** 2
+OUTPUT_TTL = float(os.environ.get("OUTPUT_TTL_HOURS", 24)) * 3600
+prediction_outputs = output_store.OutputStore(os.path.join(RESULTS_DIR, "predict"), OUTPUT_QUOTA, OUTPUT_TTL)
+comparison_outputs = output_store.OutputStore(os.path.join(RESULTS_DIR, "compare"), OUTPUT_QUOTA, OUTPUT_TTL)
+
+# cache hasil prediksi per (satelit, tanggal, provider, versi model), dibatasi CACHE_QUOTA_MB
+prediction_cache = output_store.ResultCache(os.path.join(RESULTS_DIR, "cache"),
+                                            int(os.environ.get("CACHE_QUOTA_MB", 200)) * 1024 ** 2)
+
+# URL static untuk file di dalam folder static
+def static_url(path):
+    return url_for("static", filename=os.path.relpath(path, app.static_folder).replace(os.sep, "/"))
+
+# URL gambar hasil prediksi di dalam 1 folder hasil
+def prediction_images(out_dir):
+    return {name: static_url(os.path.join(out_dir, f"{name}.png")) for name in ("prediction", "coastline")}
+
+# tanggal YYYY-M-D menjadi YYYY-MM-DD, ValueError jika format salah
+def normalize_date(text):
+    return datetime.strptime((text or "").strip(), "%Y-%m-%d").date().isoformat()
+
+# key cache hasil prediksi
+def prediction_cache_key(satelit, start_date, end_date):
+    model = sentinel_model if satelit == 'sentinel' else landsat_model
+    parts = [satelit, start_date, end_date, imagery.get_provider().name, model.model_version()]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
 @app.route("/")
 def dashboard():
     return render_template('dashboard.html')
@@ -26,6 +101,7 @@ def detail():
 def detail_with_params(year, status):
 
     # filter berdasarkan tahun
+    df_perubahan = get_data()["perubahan"]
     data = df_perubahan[df_perubahan["tahun"] == int(year)]
 
     month_order = {
@@ -74,6 +150,17 @@ def predict(satelit):
                 show_segment=False
             )
         
+        # cek format tanggal
+        try:
+            start_date, end_date = normalize_date(start_date), normalize_date(end_date)
+        except ValueError:
+            return render_template(
+                "predict.html",
+                satelit=satelit,
+                error="Format tanggal tidak valid.",
+                show_segment = False
+            )
+
         # cek kalau masukkan tanggal salah
         if start_date > end_date:
             return render_template(
@@ -83,34 +170,125 @@ def predict(satelit):
                 show_segment = False
             )
         
-        filepath = f'../web_app/static/assets/custom_model/raw_data.tif'
+        # prediksi baru butuh Earth Engine atau provider citra lokal
+        if not CAN_PREDICT:
+            return render_template(
+                "predict.html",
+                satelit=satelit,
+                error="Prediksi baru tidak tersedia pada mode offline."
+            )
 
-        # catch exception kalau misalnya gaada data di rentang tanggal masukkan
-        try:
-            # jalankan model machine learning sesuai tipe satelit yang dipilih
-            if satelit == 'sentinel':
-                sentinel_model.init_predict_sentinel(start_date, end_date)
-                coastline.extract_coastline_from_input(filepath, start_date, end_date)
-            else:
-                landsat_model.init_predict_landsat(start_date, end_date)
-                coastline.extract_coastline_from_input(filepath, start_date, end_date)
-        except EEException:
+        # hasil yang sama sudah pernah dihitung, langsung ditampilkan dari cache
+        cache_key = prediction_cache_key(satelit, start_date, end_date)
+        cached = prediction_cache.get(cache_key)
+        if cached is not None:
+            images = prediction_images(cached)
+            if request.accept_mimetypes.best == "application/json":
+                return jsonify(status="done", cached=True, result=images)
             return render_template(
                 "predict.html",
                 satelit=satelit,
-                error="Data tidak ada pada tanggal yang ditentukan."
+                start_date = start_date,
+                end_date = end_date,
+                images = images,
+                show_img_container = "show"
             )
 
+        # jalankan prediksi di background, halaman memantau status lewat /jobs/<job_id>
+        key, out_dir = prediction_outputs.create()
+        job_id = prediction_jobs.submit(run_prediction, satelit, start_date, end_date, key, out_dir, cache_key)
+        status_url = url_for("job_status", job_id=job_id)
+        if request.accept_mimetypes.best == "application/json":
+            return jsonify(job_id=job_id, status_url=status_url), 202
+
         return render_template(
             "predict.html",
             satelit=satelit,
             start_date = start_date,
             end_date = end_date,
-            show_img_container = "show"
+            status_url = status_url
         )
     
     return render_template('predict.html', satelit=satelit)
 
+"""
+Pipeline prediksi 1 job: klasifikasi + download citra, lalu ekstraksi garis pantai
+    Parameters
+    ----------
+    report: function
+        Memperbarui tahap job (dari JobQueue)
+    satelit: str
+        "sentinel" atau "landsat"
+    start_date: str
+        Tanggal mulai (YYYY-MM-DD)
+    end_date: str
+        Tanggal akhir (YYYY-MM-DD)
+    key: str
+        Nama folder hasil di prediction_outputs
+    out_dir: str
+        Folder hasil job
+    cache_key: str
+        Key hasil di prediction_cache
+
+    Returns
+    -------
+    result: dictionary
+        Nama dan path folder hasil
+"""
+def run_prediction(report, satelit, start_date, end_date, key, out_dir, cache_key):
+    filepath = os.path.join(out_dir, 'raw_data.tif')
+
+    try:
+        model = sentinel_model if satelit == 'sentinel' else landsat_model
+
+        # worker job tidak bisa menunggu autentikasi interaktif, gagal langsung dengan pesan setup
+        if imagery.get_provider().name == "earthengine":
+            report("inisialisasi Earth Engine")
+            try:
+                model.init_ee(interactive=False)
+            except EEException:
+                raise jobs.JobError("Earth Engine belum terautentikasi. Jalankan `earthengine authenticate` "
+                                    "di server lalu jalankan ulang aplikasi.")
+
+        # catch exception kalau misalnya gaada data di rentang tanggal masukkan
+        report("klasifikasi dan download citra")
+        try:
+            # jalankan model machine learning sesuai tipe satelit yang dipilih
+            if satelit == 'sentinel':
+                sentinel_model.init_predict_sentinel(start_date, end_date, filepath)
+            else:
+                landsat_model.init_predict_landsat(start_date, end_date, filepath)
+        except (EEException, imagery.ImageryNotFound):
+            raise jobs.JobError("Data tidak ada pada tanggal yang ditentukan.")
+
+        report("ekstraksi garis pantai")
+        contours_geo, offsets = coastline.extract_coastline_from_input(filepath, start_date, end_date, out_dir=out_dir)
+        np.savez(os.path.join(out_dir, "coastline.npz"), contours_geo=contours_geo, offsets=offsets)
+    finally:
+        prediction_outputs.release(key)
+
+    # simpan GeoTIFF, garis pantai, dan gambar ke cache untuk request berikutnya
+    report("menyimpan ke cache")
+    try:
+        prediction_cache.put(cache_key, out_dir)
+    except OSError as e:
+        print(f"[WARN] Gagal menyimpan cache prediksi: {e}")
+
+    return {"key": key, "out_dir": out_dir}
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = prediction_jobs.status(job_id)
+    if job is None:
+        return jsonify(error="Job tidak ditemukan."), 404
+
+    if job["result"] is not None:
+        # hasil yang dilihat diperbarui waktu aksesnya (LRU)
+        if not prediction_outputs.touch(job["result"]["key"]):
+            return jsonify(error="Hasil prediksi sudah dihapus, silakan jalankan ulang prediksi."), 410
+        job["result"] = prediction_images(job["result"]["out_dir"])
+    return jsonify(job)
+
 @app.route("/comparison", methods=['GET', 'POST'])
 def comparison():
     if request.method == 'POST':
@@ -138,14 +316,23 @@ def comparison():
         
         # generate hasil perbandingan garis pantai
         # generate buat all sama rata-rata
-        combine_hasil.generate_coastline_compare_new(int(start_year), int(end_year), coastlines_all)
-        combine_hasil.generate_coastline_compare_average(int(start_year), int(end_year), coastlines_all)
+        coastline_catalog = get_data()["catalog"]
+        key, out_dir = comparison_outputs.create()
+        try:
+            combine_hasil.generate_coastline_compare_new(int(start_year), int(end_year), coastline_catalog, out_dir)
+            combine_hasil.generate_coastline_compare_average(int(start_year), int(end_year), coastline_catalog, out_dir)
+        finally:
+            comparison_outputs.release(key)
         
         return render_template('comparison.html',
                                show_segment="show",
                                start_year=start_year,
-                               end_year=end_year)
+                               end_year=end_year,
+                               compare_all=static_url(os.path.join(out_dir, "predictionAll.png")),
+                               compare_avg=static_url(os.path.join(out_dir, "predictionAvg.png")))
     return render_template('comparison.html')
 
 if __name__ == "__main__":
+    # ekstraksi di awal agar request pertama tidak menunggu
+    get_data()
     app.run(debug=True)
\ No newline at end of file